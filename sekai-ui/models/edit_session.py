@@ -1,3 +1,4 @@
+import array
 from typing import List
 
 
@@ -14,7 +15,9 @@ class EditSession:
 
     def __init__(self):
         self.entries: List[dict] = []
-        self.rows: List[int] = []
+        # SoA paralelo a entries: linha global e speaker por índice.
+        self.rows = array.array("i")
+        self.speakers: List[str] = []
 
         self._current_lines: List[str] = []
         self._changed_indices: set[int] = set()
@@ -22,7 +25,8 @@ class EditSession:
 
     def start(self, entries: List[dict], rows: List[int]):
         self.entries = entries or []
-        self.rows = rows or []
+        self.rows = array.array("i", rows or [])
+        self.speakers = [e.get("speaker") or "" for e in self.entries]
 
         for e in self.entries:
             if "_last_committed_translation" not in e:
@@ -37,7 +41,8 @@ class EditSession:
 
     def clear(self):
         self.entries = []
-        self.rows = []
+        self.rows = array.array("i")
+        self.speakers = []
         self._current_lines = []
         self._changed_indices.clear()
         self._active = False
@@ -74,6 +79,45 @@ class EditSession:
             # Durante edição, qualquer mudança mantém o status como IN_PROGRESS.
             entry["status"] = "in_progress"
 
+    def on_line_edited(self, index: int, text: str):
+        """
+        Caso comum da digitação: só a linha `index` mudou.
+        """
+        if not self._active or not (0 <= index < len(self.entries)):
+            return
+
+        cur = self._current_lines
+        if len(cur) < len(self.entries):
+            cur.extend([""] * (len(self.entries) - len(cur)))
+
+        entry = self.entries[index]
+        cur[index] = text
+        self._changed_indices.add(index)
+        entry["translation"] = text
+        # Mesmo motivo de on_text_edited: nunca UNTRANSLATED durante digitação.
+        entry["status"] = "in_progress"
+
+    def on_lines_edited(self, first: int, last: int, lines: List[str]):
+        """
+        Como on_text_edited, mas só para as linhas first..last (inclusive)
+        alteradas no editor; as demais entries ficam intactas.
+        """
+        if not self._active:
+            return
+
+        n = len(self.entries)
+        cur = self._current_lines
+        if len(cur) < n:
+            cur.extend([""] * (n - len(cur)))
+
+        for i, text in zip(range(max(0, first), min(last + 1, n)), lines):
+            entry = self.entries[i]
+            cur[i] = text
+            self._changed_indices.add(i)
+            entry["translation"] = text
+            # Mesmo motivo de on_text_edited: nunca UNTRANSLATED durante digitação.
+            entry["status"] = "in_progress"
+
     def commit(self) -> list[int]:
         """
         Confirma traduções.
@@ -0,0 +1,660 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QTimer, Signal
+
+from models import project_state_store
+from parsers.autodetect import select_parser
+from parsers.base import ParseContext
+from services.encoding_service import DecodedText, EncodingService
+from services.regex_cache import compile_cached
+
+try:
+    import regex as _bulk_re
+except ImportError:
+    _bulk_re = None
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+try:
+    import cchardet as _chardet
+except ImportError:
+    try:
+        import charset_normalizer as _chardet
+    except ImportError:
+        _chardet = None
+
+
+# Os workers do Replace All leem/gravam o estado do projeto e chamam os
+# parsers em paralelo; nenhum dos dois foi escrito pensando em threads
+# (arquivos .json do estado, singleton do ParserManager), então o acesso é
+# serializado. Leitura, decode e regex continuam em paralelo.
+_STATE_LOCK = threading.Lock()
+_PARSE_LOCK = threading.Lock()
+
+_REGEX_META = frozenset(".^$*+?{}[]|()")
+
+# Separador do modo em lote (ASCII "record separator").
+_BATCH_SEP = "\x1e"
+# Asserções de largura zero que olham além da própria entry: com as entries
+# concatenadas elas veriam o separador/vizinhos e mudariam de resultado.
+_BATCH_UNSAFE = ("^", "$", "\\A", "\\Z", "\\z", "\\b", "\\B", "\\G", "(?=", "(?!", "(?<=", "(?<!")
+
+# Classes que no RE2 são só ASCII (no `re` são Unicode): com elas a pré-checagem
+# poderia dizer "sem match" em texto japonês que o `re` casaria.
+_RE2_UNSAFE = ("\\w", "\\W", "\\d", "\\D", "\\s", "\\S", "\\b", "\\B")
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+@lru_cache(maxsize=256)
+def _compiled_bulk(pattern_str: str, flags: int = 0):
+    """Compilação para os loops de Replace All: usa o módulo `regex` (engine
+    mais rápida) quando instalado; senão, o `re` da stdlib."""
+    if _bulk_re is not None:
+        try:
+            return _bulk_re.compile(pattern_str, flags)
+        except Exception:
+            pass
+    return compile_cached(pattern_str, flags)
+
+
+@lru_cache(maxsize=256)
+def _compiled_probe(pattern_str: str, flags: int = 0):
+    """
+    Padrão RE2 (tempo linear, solta o GIL) só para a checagem search() antes
+    do subn(). None quando `re2` não está instalado ou o padrão não é
+    equivalente no RE2 (backrefs, lookarounds, classes Unicode...); aí a
+    checagem usa o próprio padrão do `re`/`regex`.
+    """
+    if _re2 is None or any(tok in pattern_str for tok in _RE2_UNSAFE):
+        return None
+    inline = ""
+    rest = flags & ~re.UNICODE
+    for flag, letter in _RE2_INLINE_FLAGS:
+        if rest & flag:
+            inline += letter
+            rest &= ~flag
+    if rest:
+        return None
+    try:
+        return _re2.compile(f"(?{inline}){pattern_str}" if inline else pattern_str)
+    except Exception:
+        return None
+
+
+def _literal_of(pattern_str: str) -> str | None:
+    """Texto literal equivalente ao padrão (ex.: saída de re.escape), ou None
+    se houver qualquer construção de regex."""
+    out: list[str] = []
+    it = iter(pattern_str)
+    for ch in it:
+        if ch == "\\":
+            nxt = next(it, "")
+            if not nxt or nxt.isalnum() or nxt == "_":
+                return None
+            out.append(nxt)
+        elif ch in _REGEX_META:
+            return None
+        else:
+            out.append(ch)
+    return "".join(out) or None
+
+
+class BulkReplacer:
+    """
+    subn() por entry para Replace All.
+
+    Caso comum (busca literal, case-sensitive, replacement sem escapes) vira
+    str.count + str.replace, sem passar pela engine de regex.
+    """
+
+    __slots__ = ("rx", "probe", "repl", "literal", "batchable")
+
+    def __init__(self, pattern_str: str, flags: int, repl: str):
+        self.repl = repl
+        self.literal: str | None = None
+        if not (flags & re.IGNORECASE) and "\\" not in repl:
+            self.literal = _literal_of(pattern_str)
+        self.rx = None if self.literal is not None else _compiled_bulk(pattern_str, flags)
+        self.probe = None if self.rx is None else (_compiled_probe(pattern_str, flags) or self.rx)
+
+        # Lote só quando o replacement não pode reintroduzir o separador
+        # (sem backrefs) e o padrão não tem âncoras/lookarounds. Match que
+        # consome o separador é detectado pela contagem em subn_many().
+        self.batchable = _BATCH_SEP not in repl and "\\" not in repl
+        if self.batchable:
+            if self.literal is not None:
+                self.batchable = _BATCH_SEP not in self.literal
+            else:
+                self.batchable = not any(tok in pattern_str for tok in _BATCH_UNSAFE)
+
+    @classmethod
+    def from_pattern(cls, rx: re.Pattern, repl: str) -> "BulkReplacer":
+        return cls(rx.pattern, rx.flags, repl)
+
+    def subn(self, text: str) -> tuple[str, int]:
+        lit = self.literal
+        if lit is not None:
+            n = text.count(lit)
+            if not n:
+                return text, 0
+            return text.replace(lit, self.repl), n
+        # subn() sempre materializa uma string nova; no caso comum (sem match)
+        # search() decide antes (via RE2 quando disponível, fora do GIL, para
+        # os workers do Replace All rodarem em paralelo). Em lote, isso
+        # descarta o arquivo inteiro.
+        if not self.probe.search(text):
+            return text, 0
+        return self.rx.subn(self.repl, text)
+
+    def subn_many(self, texts: list[str]) -> tuple[list[str], int]:
+        """
+        subn() sobre várias entries com uma única varredura: concatena com
+        _BATCH_SEP, substitui uma vez e separa de volta. Cai no loop por entry
+        se o padrão não for seguro para lote ou se o split não bater.
+        """
+        if self.batchable and len(texts) > 1:
+            joined = _BATCH_SEP.join(texts)
+            if joined.count(_BATCH_SEP) == len(texts) - 1:
+                new_joined, total = self.subn(joined)
+                if not total:
+                    return texts, 0
+                new_list = new_joined.split(_BATCH_SEP)
+                if len(new_list) == len(texts):
+                    return new_list, total
+
+        out: list[str] = []
+        total = 0
+        for t in texts:
+            new_t, n = self.subn(t)
+            out.append(new_t)
+            total += n
+        return out, total
+
+
+# Mesmo limite de FileOpsMixin._is_openable_candidate (evita binários enormes).
+_MAX_CANDIDATE_SIZE = 5 * 1024 * 1024
+_SKIP_DIRS = frozenset({"exports"})
+
+
+def iter_candidates(root: str, supported: frozenset[str]):
+    """
+    Percorre o projeto com os.scandir (pilha explícita), reaproveitando o tipo
+    e o stat do DirEntry em vez de os.walk + splitext/join/getsize por arquivo.
+    Ignora pastas "exports". Gera entry.path (já unido ao diretório pai).
+    """
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    if entry.is_dir():
+                        if name.lower() not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                head, dot, tail = name.rpartition(".")
+                ext = "." + tail.lower() if dot and head else ""
+                if ext and supported and ext not in supported:
+                    continue
+
+                try:
+                    if entry.stat().st_size > _MAX_CANDIDATE_SIZE:
+                        continue
+                except OSError:
+                    pass
+
+                yield entry.path
+
+
+# Janela lida pelo detector de encoding e confiança mínima do palpite.
+# Encodings de um byte (latin-1, cp125x) decodificam qualquer sequência sem
+# erro: um palpite fraco passaria na checagem strict e viraria mojibake.
+_DETECT_WINDOW = 64 * 1024
+_MIN_GUESS_CONFIDENCE = 0.8
+
+
+def _guess_encoding(raw: bytes) -> str:
+    """Palpite de encoding (cchardet / charset_normalizer) sobre os primeiros
+    64 KB; "" quando não há detector ou a confiança é baixa."""
+    if _chardet is None or not raw:
+        return ""
+    try:
+        guess = _chardet.detect(raw[:_DETECT_WINDOW]) or {}
+    except Exception:
+        return ""
+    try:
+        confidence = float(guess.get("confidence") or 0.0)
+    except (TypeError, ValueError):
+        confidence = 0.0
+    if confidence < _MIN_GUESS_CONFIDENCE:
+        return ""
+    return (guess.get("encoding") or "").strip().lower()
+
+
+@dataclass
+class FileReplaceResult:
+    abs_path: str
+    entries: list[dict]
+    encoding: str
+    newline_style: str
+    had_bom: bool
+    count: int
+
+
+def apply_saved_state(entries: list[dict], saved: list[dict] | None) -> None:
+    """
+    Aplica o estado salvo (tradução/status) sobre entries recém-parseadas:
+    por entry_id; depois por original (quando único); por fim posicional,
+    se as listas tiverem o mesmo tamanho.
+    """
+    if not (isinstance(saved, list) and saved and isinstance(entries, list)):
+        return
+
+    _isinstance = isinstance
+    _dict = dict
+    by_id: dict[str, dict] = {
+        str(se["entry_id"]): se
+        for se in saved
+        if _isinstance(se, _dict) and se.get("entry_id") is not None
+    }
+    by_original: dict[str, list[dict]] = {}
+    for se in saved:
+        if not _isinstance(se, _dict):
+            continue
+        o = se.get("original")
+        if _isinstance(o, str) and o:
+            by_original.setdefault(o, []).append(se)
+
+    if by_id:
+        by_id_get = by_id.get
+        for ce in entries:
+            if not _isinstance(ce, _dict):
+                continue
+            eid = ce.get("entry_id")
+            se = by_id_get(str(eid)) if eid is not None else None
+            if se is not None:
+                if "translation" in se:
+                    ce["translation"] = se.get("translation") or ""
+                if "status" in se:
+                    ce["status"] = se.get("status") or "untranslated"
+
+    for ce in entries:
+        if not isinstance(ce, dict):
+            continue
+        if isinstance(ce.get("translation"), str) and (ce.get("translation") or "").strip():
+            continue
+        o = ce.get("original")
+        if not (isinstance(o, str) and o):
+            continue
+        cands = by_original.get(o) or []
+        if len(cands) != 1:
+            continue
+        se = cands[0]
+        if "translation" in se:
+            ce["translation"] = se.get("translation") or ""
+        if "status" in se:
+            ce["status"] = se.get("status") or "untranslated"
+
+    if len(saved) == len(entries):
+        for ce, se in zip(entries, saved):
+            if not (isinstance(ce, dict) and isinstance(se, dict)):
+                continue
+            if "translation" in se and not (isinstance(ce.get("translation"), str) and (ce.get("translation") or "").strip()):
+                ce["translation"] = se.get("translation") or ""
+            if "status" in se and not isinstance(ce.get("status"), str):
+                ce["status"] = se.get("status") or "untranslated"
+
+
+def load_saved_state(project: dict, abs_path: str):
+    """project_state_store.load_file_state serializado (seguro em worker)."""
+    with _STATE_LOCK:
+        return project_state_store.load_file_state(project, abs_path)
+
+
+def _try_decode(raw, enc: str) -> str | None:
+    try:
+        str(raw, enc, "strict")
+        return enc
+    except Exception:
+        return None
+
+
+def _first_decodable(raw, tried: set[str], encs) -> str:
+    """Primeiro encoding de `encs` que decodifica `raw` sem erro (pula os já
+    testados em `tried`)."""
+    for enc in encs:
+        enc = (enc or "").strip()
+        if not enc or enc in tried:
+            continue
+        tried.add(enc)
+        if _try_decode(raw, enc):
+            return enc
+    return ""
+
+
+def _detect_and_decode(raw, state_encoding: str, hint_encoding: str) -> tuple[str, DecodedText] | None:
+    """
+    Escolhe o encoding de entrada e decodifica (strict). `raw` pode ser bytes
+    ou um mmap aberto. None quando nada decodifica sem perda.
+    """
+    bom_first: list[str] = []
+    head = raw[:3]
+    if head.startswith(b"\xef\xbb\xbf"):
+        bom_first.append("utf-8-sig")
+    elif head.startswith(b"\xff\xfe") or head.startswith(b"\xfe\xff"):
+        bom_first.append("utf-16")
+
+    tried: set[str] = set()
+
+    # Estado salvo, BOM, hint do projeto e UTF-8 strict primeiro. O detector
+    # só roda se nenhum deles servir, e o palpite passa na frente da lista
+    # fixa em vez de testá-la às cegas.
+    chosen = _first_decodable(raw, tried, (state_encoding, *bom_first, hint_encoding, "utf-8", "utf-8-sig"))
+    if not chosen:
+        chosen = _first_decodable(raw, tried, (_guess_encoding(raw), "cp932", "shift_jis", "windows-1252"))
+    if not chosen:
+        # Nada decodifica sem perda: gravar o estado com U+FFFD destruiria
+        # bytes do original, então o arquivo fica de fora.
+        return None
+
+    return chosen, EncodingService.decode_bytes(bytes(raw), chosen)
+
+
+def replace_in_project_file(
+    project: dict,
+    abs_path: str,
+    hint_encoding: str,
+    replacer: BulkReplacer,
+    get_tr: Callable[[dict], str],
+) -> FileReplaceResult | None:
+    """
+    Ler + detectar encoding + decodificar + parsear + substituir um arquivo fechado.
+    Roda em worker thread: não toca em Qt nem grava nada em disco.
+    Retorna None quando nada mudou; falha de leitura, encoding ou parse sobe
+    como exceção para o chamador reportar.
+    """
+    # --- ler bytes + detectar encoding original do arquivo ---
+    st = load_saved_state(project, abs_path)
+    state_encoding = (getattr(st, "encoding", "") or "").strip()
+
+    # mmap: BOM/detector leem só uma janela e o decode strict lê direto do
+    # mapeamento; a única cópia completa em bytes é a do decode final.
+    fd = os.open(abs_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        raw = mmap.mmap(fd, 0, access=mmap.ACCESS_READ) if size else b""
+        try:
+            detected = _detect_and_decode(raw, state_encoding, hint_encoding)
+        finally:
+            if isinstance(raw, mmap.mmap):
+                raw.close()
+    finally:
+        os.close(fd)
+
+    if detected is None:
+        raise ValueError("nenhum encoding decodifica o arquivo sem perda")
+    chosen, decoded = detected
+    text = decoded.text or ""
+
+    # --- parse ---
+    with _PARSE_LOCK:
+        parser = select_parser(project, abs_path, text)
+        try:
+            ctx = ParseContext(
+                file_path=abs_path,
+                project=project,
+                original_text=text,
+                encoding=chosen,
+                options={"newline_style": decoded.newline_style, "had_bom": decoded.had_bom},
+            )
+        except TypeError:
+            ctx = ParseContext(file_path=abs_path, project=project)
+
+        entries = parser.parse(ctx, text)
+    if not isinstance(entries, list):
+        return None
+
+    # --- aplicar estado salvo (tradução/status) se existir ---
+    apply_saved_state(entries, getattr(st, "entries", None) if st else None)
+
+    # --- replace ---
+    targets: list[dict] = []
+    olds: list[str] = []
+    _isinstance = isinstance
+    for e in entries:
+        if not _isinstance(e, dict):
+            continue
+        old_v = str(get_tr(e) or "")
+        if not old_v:
+            continue
+        targets.append(e)
+        olds.append(old_v)
+
+    news, count = replacer.subn_many(olds)
+    if not count:
+        return None
+
+    for e, old_v, new_v in zip(targets, olds, news):
+        if new_v != old_v:
+            e["translation"] = new_v
+
+    return FileReplaceResult(
+        abs_path=abs_path,
+        entries=entries,
+        encoding=chosen,
+        newline_style=decoded.newline_style,
+        had_bom=decoded.had_bom,
+        count=count,
+    )
+
+
+def save_replace_result(project: dict, res: FileReplaceResult) -> None:
+    """Grava o estado do arquivo substituído (não exporta o arquivo final).
+    Erros de gravação sobem para o chamador."""
+    with _STATE_LOCK:
+        try:
+            # mantém encoding original detectado
+            project_state_store.save_file_state(
+                project,
+                res.abs_path,
+                res.entries,
+                encoding=res.encoding,
+                newline_style=res.newline_style,
+                had_bom=res.had_bom,
+            )
+        except TypeError:
+            # compat com assinatura antiga
+            project_state_store.save_file_state(project, res.abs_path, res.entries)
+
+
+# Arquivos por rodada do Replace All em modo UI thread (run_stepwise).
+_STEP_BATCH = 16
+
+
+class ReplaceAllSignals(QObject):
+    progress = Signal(int, int)  # done, total
+    finished = Signal(int, list)  # total de substituições, erros por arquivo
+    failed = Signal(str)
+
+
+class ReplaceAllRunnable(QRunnable):
+    """
+    Replace All no projeto fora da UI thread (QThreadPool).
+
+    Faz o walk, processa os arquivos fechados no ThreadPoolExecutor e grava o
+    estado de cada um. `root` precisa ser absoluto. Arquivos já abertos em
+    abas (`skip_paths`, snapshot em normcase) ficam de fora: esses são tratados em memória pela UI thread.
+
+    Arquivo que falha (leitura, encoding, parse, gravação) entra em `errors`
+    e segue para o próximo; falha do job inteiro sai por signals.failed.
+    """
+
+    def __init__(
+        self,
+        project: dict,
+        root: str,
+        supported: frozenset[str],
+        skip_paths: set[str],
+        hint_encoding: str,
+        replacer: BulkReplacer,
+        get_tr: Callable[[dict], str],
+    ):
+        super().__init__()
+        self.signals = ReplaceAllSignals()
+        self.project = project
+        self.root = root
+        self.supported = supported
+        self.skip_paths = skip_paths
+        self.hint_encoding = hint_encoding
+        self.replacer = replacer
+        self.get_tr = get_tr
+        self.errors: list[str] = []
+        self._cancel = False
+
+    def cancel(self) -> None:
+        self._cancel = True
+
+    def run(self) -> None:
+        try:
+            total = self._run()
+        except Exception as e:
+            self.signals.failed.emit(str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit(int(total), list(self.errors))
+
+    def _record_error(self, abs_path: str, exc: Exception) -> None:
+        try:
+            shown = os.path.relpath(abs_path, self.root)
+        except ValueError:
+            shown = abs_path
+        self.errors.append(f"{shown}: {exc}")
+
+    def _collect_candidates(self) -> list[str] | None:
+        """Arquivos fechados do projeto; None se cancelado durante o walk."""
+        skip_paths = self.skip_paths
+        normcase = os.path.normcase
+        candidates: list[str] = []
+        # root já é absoluto, então os caminhos do scandir também são: nada
+        # de os.path.abspath (getcwd + normpath) por arquivo.
+        for abs_path in iter_candidates(self.root, self.supported):
+            if self._cancel:
+                return None
+            if normcase(abs_path) in skip_paths:
+                continue
+            candidates.append(abs_path)
+        return candidates
+
+    def _run(self) -> int:
+        candidates = self._collect_candidates()
+        if candidates is None:
+            return 0
+
+        n = len(candidates)
+        self.signals.progress.emit(0, n)
+        if not n:
+            return 0
+
+        total_replacements = 0
+        done = 0
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    replace_in_project_file,
+                    self.project,
+                    abs_path,
+                    self.hint_encoding,
+                    self.replacer,
+                    self.get_tr,
+                ): abs_path
+                for abs_path in candidates
+            }
+            for fut in as_completed(futures):
+                if self._cancel:
+                    for f in futures:
+                        f.cancel()
+                    break
+
+                done += 1
+                self.signals.progress.emit(done, n)
+                total_replacements += self._save(futures[fut], fut.result)
+
+        return total_replacements
+
+    def _save(self, abs_path: str, get_result: Callable[[], FileReplaceResult | None]) -> int:
+        """Resultado de um arquivo -> estado gravado; erro vai para `errors`."""
+        try:
+            res = get_result()
+            if res is None:
+                return 0
+            save_replace_result(self.project, res)
+        except Exception as e:
+            self._record_error(abs_path, e)
+            return 0
+        return res.count
+
+    def _process(self, abs_path: str) -> int:
+        return self._save(
+            abs_path,
+            lambda: replace_in_project_file(self.project, abs_path, self.hint_encoding, self.replacer, self.get_tr),
+        )
+
+    # -------------------------
+    # Variante sem pool (UI thread)
+    # -------------------------
+    def run_stepwise(self) -> None:
+        """
+        Mesma lógica de run(), na UI thread, em lotes de _STEP_BATCH arquivos
+        reagendados por QTimer.singleShot(0): o event loop volta a rodar entre
+        os lotes (progresso pinta, Cancelar responde). Usado quando o
+        QThreadPool não tem thread livre.
+        """
+        try:
+            candidates = self._collect_candidates()
+        except Exception as e:
+            self.signals.failed.emit(str(e) or type(e).__name__)
+            return
+        if candidates is None:
+            self.signals.finished.emit(0, list(self.errors))
+            return
+
+        n = len(candidates)
+        self.signals.progress.emit(0, n)
+        state = {"pos": 0, "total": 0}
+
+        def _step() -> None:
+            pos = state["pos"]
+            if self._cancel or pos >= n:
+                self.signals.finished.emit(int(state["total"]), list(self.errors))
+                return
+
+            end = min(n, pos + _STEP_BATCH)
+            for abs_path in candidates[pos:end]:
+                state["total"] += self._process(abs_path)
+            state["pos"] = end
+            self.signals.progress.emit(end, n)
+            QTimer.singleShot(0, _step)
+
+        QTimer.singleShot(0, _step)
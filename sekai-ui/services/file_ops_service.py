@@ -13,10 +13,10 @@ from models import project_state_store
 
 
 def open_file(main_window: Any, index: QModelIndex) -> None:
-    """Abre arquivo a partir do tree view (QFileSystemModel).
+    """Abre arquivo a partir do tree view (ProjectTreeModel).
 
     Espera que main_window tenha:
-      - fs_model (QFileSystemModel)
+      - fs_model (ProjectTreeModel)
       - tabs (QTabWidget)
       - current_project (dict)
       - _open_files (dict[path->FileTab]) (opcional)
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def compile_cached(pattern_str: str, flags: int = 0) -> re.Pattern:
+    """re.compile com cache por (pattern, flags): Replace All / buscas repetidas
+    não recompilam o mesmo padrão."""
+    return re.compile(pattern_str, flags)
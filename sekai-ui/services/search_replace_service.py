@@ -3,15 +3,22 @@ from __future__ import annotations
 import os
 import re
 import copy
-from typing import Any
+from typing import Any, Callable
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QProgressDialog
+from PySide6.QtCore import QObject, QThreadPool, Qt, Slot
 
 from parsers.autodetect import select_parser
 from parsers.base import ParseContext
 from parsers.manager import get_parser_manager
 from models import project_state_store
+from services.bulk_replace import (
+    BulkReplacer,
+    ReplaceAllRunnable,
+    apply_saved_state,
+    load_saved_state,
+)
+from services.regex_cache import compile_cached
 
 from views.dialogs.search_dialog import SearchResult
 
@@ -29,6 +36,9 @@ class SearchReplaceService:
 
     def __init__(self, main_window):
         self._mw = main_window
+        # Replace All no projeto em andamento (evita disparar dois jobs).
+        self._replace_all_job = None
+        self._replace_all_bridge = None
 
     def __getattr__(self, name: str):
         return getattr(self._mw, name)
@@ -182,11 +192,11 @@ class SearchReplaceService:
 
         if use_regex:
             try:
-                return re.compile(q, flags)
+                return compile_cached(q, flags)
             except re.error as e:
                 raise RuntimeError(f"Regex inválido: {e}")
 
-        return re.compile(re.escape(q), flags)
+        return compile_cached(re.escape(q), flags)
 
     def _search_entry_matches(self, rx: re.Pattern, entry: dict, *, in_original: bool, in_translation: bool) -> list[str]:
         """Return a list of matched fields: ['original', 'translation'].
@@ -222,6 +232,11 @@ class SearchReplaceService:
 
         results: list[SearchResult] = []
 
+        try:
+            tab.flush_pending_edits()
+        except Exception:
+            pass
+
         for i, e in enumerate(getattr(tab, "_entries", []) or []):
             if not isinstance(e, dict):
                 continue
@@ -273,6 +288,8 @@ class SearchReplaceService:
         try:
             for p, tab in (self._open_files or {}).items():
                 ap = os.path.abspath(p)
+                if hasattr(tab, "flush_pending_edits"):
+                    tab.flush_pending_edits()
                 ents = getattr(tab, "_entries", None)
                 if isinstance(ents, list) and ap:
                     open_entries_by_path[ap] = ents
@@ -471,6 +488,10 @@ class SearchReplaceService:
 
         _, tab = self._get_open_tab_for_path(path)
         if tab is not None:
+            try:
+                tab.flush_pending_edits()
+            except Exception:
+                pass
             entries = getattr(tab, "_entries", []) or []
             row = int(res.source_row)
             if not (0 <= row < len(entries)):
@@ -558,11 +579,20 @@ class SearchReplaceService:
             return False
 
     
-    def _search_replace_all(self, query: str, replace_text: str, params: dict) -> int:
+    def _search_replace_all(
+        self,
+        query: str,
+        replace_text: str,
+        params: dict,
+        on_done: Callable[[int, list], None] | None = None,
+    ) -> int | None:
         """Replace all matches according to params.
 
         Safety: replacement only applies to the 'translation' field.
         Returns the total number of *occurrences* replaced (not rows).
+
+        Escopo "project" roda em segundo plano: devolve None e o total (mais
+        os erros por arquivo) chega depois em on_done(total, errors).
         """
         if not self.current_project:
             return 0
@@ -578,33 +608,48 @@ class SearchReplaceService:
                 return 0
             return int(self._replace_all_in_open_tab(tab, rx, replace_text) or 0)
 
-        return int(self._replace_all_in_project(rx, replace_text) or 0)
+        return self._replace_all_in_project(rx, replace_text, on_done)
 
     def _replace_all_in_open_tab(self, tab, rx, replace_text: str) -> int:
         """Replace in an opened FileTab (in-memory), with undo."""
         if not tab:
             return 0
 
+        try:
+            tab.flush_pending_edits()
+        except Exception:
+            pass
+
         entries = getattr(tab, "_entries", []) or []
         if not entries:
             return 0
 
-        changed_rows: list[int] = []
-        before: list[dict] = []
-        after: list[dict] = []
-        total_occ = 0
+        replacer = BulkReplacer.from_pattern(rx, replace_text)
 
+        rows: list[int] = []
+        olds: list[str] = []
+        _get_tr = self._entry_translation_text
         for i, e in enumerate(entries):
             if not isinstance(e, dict):
                 continue
-
-            old_v = str(self._entry_translation_text(e) or "")
-            new_v, n = rx.subn(replace_text, old_v)
-            if n <= 0:
+            old_v = str(_get_tr(e) or "")
+            if not old_v:
                 continue
+            rows.append(i)
+            olds.append(old_v)
 
-            total_occ += int(n)
+        news, total_occ = replacer.subn_many(olds)
+        if not total_occ:
+            return 0
 
+        changed_rows: list[int] = []
+        before: list[dict] = []
+        after: list[dict] = []
+        for i, old_v, new_v in zip(rows, olds, news):
+            if new_v == old_v:
+                continue
+
+            e = entries[i]
             changed_rows.append(i)
             before.append({"translation": old_v, "status": e.get("status") or "untranslated"})
             e["translation"] = new_v
@@ -648,139 +693,146 @@ class SearchReplaceService:
             return
 
         try:
-            st = project_state_store.load_file_state(self.current_project, path)
+            st = load_saved_state(self.current_project, path)
             saved = getattr(st, "entries", None) if st else None
         except Exception:
             saved = None
 
-        if not (isinstance(saved, list) and saved):
-            return
-
-        by_id: dict[str, dict] = {}
-        by_original: dict[str, list[dict]] = {}
-
-        for se in saved:
-            if not isinstance(se, dict):
-                continue
-            se_eid = se.get("entry_id")
-            if se_eid is not None:
-                by_id[str(se_eid)] = se
-            o = se.get("original")
-            if isinstance(o, str) and o:
-                by_original.setdefault(o, []).append(se)
-
-        if by_id:
-            for ce in entries:
-                if not isinstance(ce, dict):
-                    continue
-                eid = ce.get("entry_id")
-                key = str(eid) if eid is not None else ""
-                if key and key in by_id:
-                    se = by_id[key]
-                    if "translation" in se:
-                        ce["translation"] = se.get("translation") or ""
-                    if "status" in se:
-                        ce["status"] = se.get("status") or "untranslated"
-
-        for ce in entries:
-            if not isinstance(ce, dict):
-                continue
-            if isinstance(ce.get("translation"), str) and (ce.get("translation") or "").strip():
-                continue
-            o = ce.get("original")
-            if not (isinstance(o, str) and o):
-                continue
-            cands = by_original.get(o) or []
-            if len(cands) != 1:
-                continue
-            se = cands[0]
-            if "translation" in se:
-                ce["translation"] = se.get("translation") or ""
-            if "status" in se:
-                ce["status"] = se.get("status") or "untranslated"
-
-        if len(saved) == len(entries):
-            for ce, se in zip(entries, saved):
-                if not (isinstance(ce, dict) and isinstance(se, dict)):
-                    continue
-                if "translation" in se and not (isinstance(ce.get("translation"), str) and (ce.get("translation") or "").strip()):
-                    ce["translation"] = se.get("translation") or ""
-                if "status" in se and not isinstance(ce.get("status"), str):
-                    ce["status"] = se.get("status") or "untranslated"
-
-    def _replace_all_in_project(self, rx, replace_text: str) -> int:
-        """Replace across project files (persisting state for closed files)."""
+        apply_saved_state(entries, saved)
+
+    def _replace_all_in_project(
+        self,
+        rx,
+        replace_text: str,
+        on_done: Callable[[int, list], None] | None = None,
+    ) -> int | None:
+        """Replace across project files (persisting state for closed files).
+
+        Abas abertas são substituídas na hora (em memória, com undo); os
+        arquivos fechados vão para um ReplaceAllRunnable no QThreadPool. Um
+        QProgressDialog modal (application-wide) cobre o job: nada na UI pode
+        disparar outro Replace All nem fechar abas até o finished, que chama
+        on_done(total, errors). Devolve None quando o job foi iniciado.
+        """
         if not self.current_project:
             return 0
 
-        root = (self.current_project.get("root_path") or "").strip()
-        if not root or not os.path.isdir(root):
+        if self._replace_all_job is not None:
             return 0
 
-        supported = self._supported_extensions()
-        encoding = (self.current_project.get("encoding") or "utf-8").strip() or "utf-8"
-
-        total_occ = 0
+        project = self.current_project
+        root = (project.get("root_path") or "").strip()
+        if not root or not os.path.isdir(root):
+            return 0
+        root = os.path.abspath(root)
+
+        # Um hash lookup por arquivo no walk, seja qual for o tipo devolvido.
+        supported = frozenset(self._supported_extensions() or ())
+
+        # hint apenas (entrada real é detectada por arquivo)
+        hint_encoding = (project.get("encoding") or "utf-8").strip() or "utf-8"
+        if hint_encoding.lower() == "auto":
+            hint_encoding = "utf-8"
+
+        # 1) Abas abertas operam em memória (inclui não-salvo) e precisam rodar
+        #    na UI thread, antes do job. Snapshot: sinais disparados durante as
+        #    substituições não mexem no conjunto que o job consulta.
+        root_cmp = self._norm_path(root) + os.sep
+        open_tabs = [(self._norm_path(k), t) for k, t in list((self._open_files or {}).items()) if k]
+        open_paths = {norm for norm, _ in open_tabs}
+        open_occ = 0
+        for norm, tab in open_tabs:
+            if not norm.startswith(root_cmp):
+                continue
+            # Mesmo corte do walk: nada dentro de pastas "exports".
+            if any(d.lower() == "exports" for d in norm[len(root_cmp):].split(os.sep)[:-1]):
+                continue
+            ext = os.path.splitext(norm)[1].lower()
+            if ext and supported and ext not in supported:
+                continue
+            open_occ += int(self._replace_all_in_open_tab(tab, rx, replace_text) or 0)
+
+        # 2) Arquivos fechados: walk + workers + gravação do estado fora da UI.
+        job = ReplaceAllRunnable(
+            project,
+            root,
+            supported,
+            open_paths,
+            hint_encoding,
+            BulkReplacer.from_pattern(rx, replace_text),
+            self._entry_translation_text,
+        )
+
+        parent = QApplication.activeModalWidget() or self._mw
+        dlg = QProgressDialog("Substituindo no projeto...", "Cancelar", 0, 0, parent)
+        dlg.setWindowTitle("Substituir tudo")
+        dlg.setWindowModality(Qt.ApplicationModal)
+        dlg.setMinimumDuration(0)
+        dlg.setAutoClose(False)
+        dlg.setAutoReset(False)
+        dlg.canceled.connect(job.cancel)
+
+        def _on_progress(done: int, total: int) -> None:
+            try:
+                if dlg.maximum() != total:
+                    dlg.setMaximum(total)
+                dlg.setValue(done)
+            except Exception:
+                pass
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            for base, dirs, files in os.walk(root):
-                dirs[:] = [d for d in dirs if d.lower() != "exports"]
+        def _finish(total: int, errors: list) -> None:
+            self._replace_all_job = None
+            self._replace_all_bridge = None
+            try:
+                dlg.close()
+                dlg.deleteLater()
+            except Exception:
+                pass
 
-                for fn in files:
-                    ext = os.path.splitext(fn)[1].lower()
-                    if ext and supported and ext not in supported:
-                        continue
+            try:
+                self._refresh_tree_progress(None)
+            except Exception:
+                pass
 
-                    path = os.path.join(base, fn)
-                    if not self._is_openable_candidate(path):
-                        continue
+            if on_done is not None:
+                on_done(int(total) + open_occ, list(errors or []))
 
-                    abs_path = os.path.abspath(path)
+        def _on_failed(msg: str) -> None:
+            _finish(0, [f"Falha na substituição do projeto: {msg}"])
 
-                    _, tab = self._get_open_tab_for_path(abs_path)
-                    if tab is not None:
-                        total_occ += int(self._replace_all_in_open_tab(tab, rx, replace_text) or 0)
-                        continue
+        bridge = _ReplaceAllBridge(_on_progress, _finish, _on_failed)
+        job.signals.progress.connect(bridge.on_progress, type=Qt.QueuedConnection)
+        job.signals.finished.connect(bridge.on_finished, type=Qt.QueuedConnection)
+        job.signals.failed.connect(bridge.on_failed, type=Qt.QueuedConnection)
 
-                    try:
-                        with open(abs_path, "r", encoding=encoding, errors="replace") as f:
-                            text = f.read()
-                    except Exception:
-                        continue
+        # Mantém referências até o finished (os sinais vivem no job).
+        self._replace_all_job = job
+        self._replace_all_bridge = bridge
+        dlg.show()
+        if not QThreadPool.globalInstance().tryStart(job):
+            # Pool sem thread livre: roda em lotes na UI thread.
+            job.setAutoDelete(False)
+            job.run_stepwise()
+        return None
 
-                    try:
-                        parser = select_parser(self.current_project, abs_path, text)
-                        ctx = ParseContext(file_path=abs_path, project=self.current_project, original_text=text)
-                        entries = parser.parse(ctx, text)
-                        if not isinstance(entries, list):
-                            continue
-                    except Exception:
-                        continue
 
-                    self._apply_saved_state_to_entries(abs_path, entries)
+class _ReplaceAllBridge(QObject):
+    """Entrega os sinais do ReplaceAllRunnable na UI thread (QueuedConnection)."""
 
-                    changed = False
-                    file_occ = 0
+    def __init__(self, on_progress, on_finished, on_failed):
+        super().__init__()
+        self._on_progress = on_progress
+        self._on_finished = on_finished
+        self._on_failed = on_failed
 
-                    for e in entries:
-                        if not isinstance(e, dict):
-                            continue
-                        old_v = str(self._entry_translation_text(e) or "")
-                        new_v, n = rx.subn(replace_text, old_v)
-                        if n <= 0:
-                            continue
-                        file_occ += int(n)
-                        e["translation"] = new_v
-                        changed = True
+    @Slot(int, int)
+    def on_progress(self, done: int, total: int) -> None:
+        self._on_progress(done, total)
 
-                    if changed:
-                        try:
-                            project_state_store.save_file_state(self.current_project, abs_path, entries)
-                            total_occ += int(file_occ)
-                        except Exception:
-                            pass
-        finally:
-            QApplication.restoreOverrideCursor()
+    @Slot(int, list)
+    def on_finished(self, total: int, errors: list) -> None:
+        self._on_finished(total, errors)
 
-        return int(total_occ)
+    @Slot(str)
+    def on_failed(self, msg: str) -> None:
+        self._on_failed(msg)
@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 import os
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 from datetime import datetime
 
@@ -53,6 +53,7 @@ class ImportReport:
     skipped_older: int
     conflicts: List[Conflict]
     base_mismatch: int
+    applied_paths: List[str] = field(default_factory=list)
 
 
 def export_sync_snapshot(project: dict) -> dict:
@@ -157,6 +158,7 @@ def import_sync_snapshot(project: dict, payload: dict, *, prefer_incoming_on_con
     applied = 0
     skipped_older = 0
     conflicts: List[Conflict] = []
+    applied_paths: List[str] = []
 
     files = payload.get("files") or []
     if not isinstance(files, list):
@@ -190,6 +192,8 @@ def import_sync_snapshot(project: dict, payload: dict, *, prefer_incoming_on_con
         if not isinstance(incoming_entries, list):
             continue
 
+        applied_before = applied
+
         for ie in incoming_entries:
             if not isinstance(ie, dict):
                 continue
@@ -256,5 +260,13 @@ def import_sync_snapshot(project: dict, payload: dict, *, prefer_incoming_on_con
 
         
         project_state_store.save_file_state(project, abs_file, local_entries)
-
-    return ImportReport(applied=applied, skipped_older=skipped_older, conflicts=conflicts, base_mismatch=base_mismatch)
+        if applied > applied_before:
+            applied_paths.append(abs_file)
+
+    return ImportReport(
+        applied=applied,
+        skipped_older=skipped_older,
+        conflicts=conflicts,
+        base_mismatch=base_mismatch,
+        applied_paths=applied_paths,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -53,6 +53,7 @@ class ProgressDialog(QDialog):
     def set_message(self, message: str) -> None:
         self.label.setText(message)
 
+    @Slot(int)
     def set_total(self, total: int) -> None:
         total = int(total or 0)
         self._total = max(0, total)
@@ -66,6 +67,7 @@ class ProgressDialog(QDialog):
 
         self._update_text()
 
+    @Slot(int)
     def set_progress(self, done: int) -> None:
         done = int(done or 0)
 
@@ -86,5 +88,6 @@ class ProgressDialog(QDialog):
         else:
             self.bar.setFormat("Processando...")
 
+    @Slot()
     def _on_cancel(self) -> None:
         self.canceled.emit()
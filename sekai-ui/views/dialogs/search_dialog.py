@@ -41,7 +41,8 @@ class SearchDialog(QDialog):
     - do_search(query, params) -> list[SearchResult]
     - open_result(SearchResult) -> None
     - replace_one(SearchResult, query, replace_text, params) -> bool
-    - replace_all(query, replace_text, params) -> int
+    - replace_all(query, replace_text, params, on_done) -> int | None
+      (None = segue em segundo plano e o resultado chega em on_done(total, errors))
     """
 
     def __init__(
@@ -52,7 +53,7 @@ class SearchDialog(QDialog):
         do_search: Callable[[str, dict], list[SearchResult]],
         open_result: Callable[[SearchResult], None],
         replace_one: Callable[[SearchResult, str, str, dict], bool],
-        replace_all: Callable[[str, str, dict], int],
+        replace_all: Callable[[str, str, dict, Callable[[int, list], None]], int | None],
     ):
         super().__init__(parent)
 
@@ -286,12 +287,30 @@ class SearchDialog(QDialog):
         params = self._params()
 
         try:
-            n = int(self._replace_all(q, repl, params) or 0)
+            n = self._replace_all(q, repl, params, self._on_replace_all_done)
         except Exception as e:
             QMessageBox.critical(self, "Substituir tudo", str(e))
             return
 
-        QMessageBox.information(self, "Substituir tudo", f"Substituições aplicadas: {n}")
+        if n is None:
+            # Substituição no projeto em segundo plano: o total chega em
+            # _on_replace_all_done quando o job terminar.
+            return
+        self._on_replace_all_done(int(n or 0), [])
+
+    def _on_replace_all_done(self, n: int, errors: list) -> None:
+        if errors:
+            shown = "\n".join(str(e) for e in errors[:10])
+            if len(errors) > 10:
+                shown += f"\n... (+{len(errors) - 10})"
+            QMessageBox.warning(
+                self,
+                "Substituir tudo",
+                f"Substituições aplicadas: {n}\n\n"
+                f"Problemas ({len(errors)}):\n{shown}",
+            )
+        else:
+            QMessageBox.information(self, "Substituir tudo", f"Substituições aplicadas: {n}")
         self._on_search_clicked()
 
     def _open_selected(self) -> None:
@@ -125,6 +125,13 @@ class EditorPanel(QWidget):
         except Exception:
             pass
 
+    def flush_pending_edits(self) -> None:
+        """Aplica nas entries o que ainda está no debounce do editor de tradução."""
+        try:
+            self.translation_editor.flush_pending_edits()
+        except Exception:
+            pass
+
     def start_edit_session(self, entries: list[dict], rows: list[int]):
         self._refresh_timer.stop()
         self._pending_refresh_source_rows.clear()
@@ -139,13 +146,11 @@ class EditorPanel(QWidget):
         te = self.translation_editor
         te.bind_edit_session(self._session)
         te.set_rows(rows)
-        te._loading_session = True
-        try:
-            te.load_from_session()
-        finally:
-            te._loading_session = False
-
+        # sessões grandes montam o documento fora da UI thread
+        te.load_from_session_async(self._on_translation_loaded)
 
+    def _on_translation_loaded(self) -> None:
+        te = self.translation_editor
         te.update()
         te.viewport().update()
 
@@ -154,11 +159,14 @@ class EditorPanel(QWidget):
             self.translation_with_gutter.gutter.update()
 
     def clear(self):
+        # o debounce ainda aponta para a sessão atual: aplica antes de limpá-la
+        self.flush_pending_edits()
         self._refresh_timer.stop()
         self._pending_refresh_source_rows.clear()
         self._session.clear()
         self._entries = []
         self._rows = []
+        self.original_editor.mark_dirty()
         self.original_editor.setPlainText("")
         self.translation_editor.setPlainText("")
 
@@ -168,6 +176,8 @@ class EditorPanel(QWidget):
         if not self._file_tab:
             return
 
+        self.translation_editor.flush_pending_edits()
+
         session_rows = list(self._session.rows or [])
         before_all = self._file_tab.snapshot_rows(session_rows)
 
@@ -244,6 +254,8 @@ class EditorPanel(QWidget):
     def _flush_pending_row_refreshes(self):
         if not self._file_tab or not self._pending_refresh_source_rows:
             return
+        # a tabela lê das entries: aplica antes o que está no debounce do editor
+        self.translation_editor.flush_pending_edits()
         rows = sorted(self._pending_refresh_source_rows)
         self._pending_refresh_source_rows.clear()
         try:
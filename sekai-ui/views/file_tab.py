@@ -328,7 +328,20 @@ class FileTab(QWidget):
             except Exception:
                 return
 
+    def flush_pending_edits(self) -> None:
+        """
+        Aplica em self._entries as edições ainda no debounce do editor.
+        Chamar antes de ler/salvar as entries ou de alterá-las por fora do
+        editor (undo/redo, IA, replace): senão o flush atrasado grava o texto
+        antigo por cima.
+        """
+        try:
+            self.editor.flush_pending_edits()
+        except Exception:
+            pass
+
     def undo(self) -> None:
+        self.flush_pending_edits()
         act = self._undo.pop_undo()
         if not act:
             return
@@ -352,6 +365,7 @@ class FileTab(QWidget):
         self._refresh_editor_from_selection()
 
     def redo(self) -> None:
+        self.flush_pending_edits()
         act = self._undo.pop_redo()
         if not act:
             return
@@ -380,6 +394,7 @@ class FileTab(QWidget):
     def save_project_state(self, project: dict) -> None:
         if not self.file_path:
             return
+        self.flush_pending_edits()
         project_state_store.save_file_state(
             project,
             self.file_path,
@@ -483,6 +498,7 @@ class FileTab(QWidget):
         if not hasattr(parser, "rebuild") or not callable(getattr(parser, "rebuild")):
             raise RuntimeError("parser inválido: não implementa rebuild(ctx, entries)")
 
+        self.flush_pending_edits()
         out_data = parser.rebuild(ctx, self._entries)
 
         out_path = self.compute_export_path(project, self.file_path)
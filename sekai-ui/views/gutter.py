@@ -133,17 +133,23 @@ class EditorGutter(QWidget):
         )
 
         line_height = editor.fontMetrics().height()
-
-        while block.isValid() and top <= event.rect().bottom():
+        # resolvidos uma vez por paint, não por bloco visível
+        get_meta = getattr(editor, "get_meta_for_block", None)
+        text_right = self.width() - 6
+        rect_bottom = event.rect().bottom()
+        rect_top = event.rect().top()
+        painter.setPen(self._cached_fg)
+
+        while block.isValid() and top <= rect_bottom:
             height = int(editor.blockBoundingRect(block).height())
             bottom = top + height
 
-            if block.isVisible() and bottom >= event.rect().top():
+            if block.isVisible() and bottom >= rect_top:
                 number_text = ""
                 speaker_text = ""
 
-                if hasattr(editor, "get_meta_for_block"):
-                    row, speaker = editor.get_meta_for_block(block_number)
+                if get_meta is not None:
+                    row, speaker = get_meta(block_number)
                     if row is not None:
                         number_text = f"{row + 1}."
                     if speaker:
@@ -153,12 +159,11 @@ class EditorGutter(QWidget):
                 if speaker_text:
                     text += f" {speaker_text}"
 
-                painter.setPen(self._cached_fg)
                 painter.drawText(
                     QRect(
                         0,
                         top,
-                        self.width() - 6,
+                        text_right,
                         line_height,
                     ),
                     Qt.AlignRight | Qt.AlignVCenter,
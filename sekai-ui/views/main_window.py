@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide6.QtCore import QThread, QTimer
+from PySide6.QtCore import QSettings, QThread, QTimer
 from PySide6.QtWidgets import QMainWindow, QMessageBox
 
 from services.search_replace_service import SearchReplaceService
@@ -40,6 +40,7 @@ class MainWindow(
         self.core = core_client
         self.app_version = (app_version or "0.0.0").strip() or "0.0.0"
         self.app_name = (app_name or "SekaiTranslatorV").strip() or "SekaiTranslatorV"
+        self._settings_cached = QSettings(self.app_name, self.app_name)
         self.current_project: dict | None = None
 
         self.search_service = SearchReplaceService(self)
@@ -66,6 +67,8 @@ class MainWindow(
 
         self._ai_ctx: dict | None = None
 
+        self._refresh_pending = False
+
         self.setWindowTitle(self.app_name)
         self.resize(1500, 900)
 
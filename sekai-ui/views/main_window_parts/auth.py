@@ -8,7 +8,7 @@ import re
 import time
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import Qt, QSettings, QThread, QTimer, QObject, Signal
+from PySide6.QtCore import Qt, QSettings, QThread, QTimer, QObject, Signal, Slot
 from PySide6.QtGui import QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -93,6 +93,7 @@ class AuthMixin:
         return "https://green-gaur-846876.hostingersite.com/api/proxy.php"
 
 
+    @Slot()
     def _login(self):
         from views.dialogs.login_dialog import LoginDialog
         dlg = LoginDialog(self)
@@ -104,6 +105,7 @@ class AuthMixin:
             self._refresh_project_state()
 
 
+    @Slot()
     def _logout(self):
         self.current_user = None
         self.api_token = None
@@ -123,13 +125,9 @@ class AuthMixin:
 
 
     def _refresh_account_menu(self):
-        if self.current_user:
-            self.account_menu.setTitle(f"👤 {self.current_user}")
-            self.action_login.setVisible(False)
-            self.action_logout.setVisible(True)
-        else:
-            self.account_menu.setTitle("Conta")
-            self.action_login.setVisible(True)
-            self.action_logout.setVisible(False)
+        logged = bool(self.current_user)
+        self.account_menu.setTitle(f"👤 {self.current_user}" if logged else "Conta")
+        self.action_login.setVisible(not logged)
+        self.action_logout.setVisible(logged)
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Any
 
+from PySide6.QtCore import Slot
 from PySide6.QtWidgets import QMessageBox
 
 from views.file_tab import FileTab
@@ -18,6 +19,7 @@ from parsers.base import ParseContext
 
 
 class ExportOpsMixin:
+    @Slot()
     def _export_current_file(self):
         tab = self._current_file_tab()
         if not tab or not self.current_project or not tab.file_path:
@@ -115,6 +117,7 @@ class ExportOpsMixin:
         done, total, percent = self._compute_entries_progress(entries)
         return percent >= 100, done, total, percent
 
+    @Slot()
     def _export_project_batch(self):
         if not self.current_project:
             return
@@ -166,6 +169,8 @@ class ExportOpsMixin:
                         open_files = getattr(self, '_open_files', None) or {}
                         live_tab = open_files.get(src_path)
                         if live_tab is not None and hasattr(live_tab, '_entries'):
+                            if hasattr(live_tab, 'flush_pending_edits'):
+                                live_tab.flush_pending_edits()
                             is_full, done, total, percent = self._is_file_fully_translated(getattr(live_tab, '_entries', None) or [])
                             if not is_full:
                                 count_skipped_not_full += 1
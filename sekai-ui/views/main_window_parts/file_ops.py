@@ -8,7 +8,7 @@ import re
 import time
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import Qt, QSettings, QThread, QTimer, QObject, Signal
+from PySide6.QtCore import Qt, QModelIndex, QSettings, QThread, QTimer, QObject, Signal, Slot
 from PySide6.QtGui import QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -84,10 +84,12 @@ class FileOpsMixin:
         return True
 
 
+    @Slot(QModelIndex)
     def _on_tree_double_clicked(self, index):
         self._open_file(index)
 
 
+    @Slot(int)
     def _close_tab(self, index: int):
         widget = self.tabs.widget(index)
 
@@ -127,11 +129,13 @@ class FileOpsMixin:
             return w
         return None
 
+    @Slot()
     def _undo_current(self):
         tab = self._current_file_tab()
         if tab and hasattr(tab, "undo"):
             tab.undo()
 
+    @Slot()
     def _redo_current(self):
         tab = self._current_file_tab()
         if tab and hasattr(tab, "redo"):
@@ -139,6 +143,8 @@ class FileOpsMixin:
 
 
     def _get_tab_entries(self, tab: FileTab) -> list[dict]:
+        if hasattr(tab, "flush_pending_edits"):
+            tab.flush_pending_edits()
         if hasattr(tab, "_entries"):
             return tab._entries or []
         if hasattr(tab, "model") and hasattr(tab.model, "entries"):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import functools
 from pathlib import Path
 import json
 import copy
@@ -8,7 +9,7 @@ import re
 import time
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import Qt, QSettings, QThread, QTimer, QObject, Signal
+from PySide6.QtCore import Qt, QSettings, QThread, QTimer, QObject, Signal, Slot
 from PySide6.QtGui import QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -42,6 +43,29 @@ from parsers.autodetect import select_parser
 from parsers.manager import get_parser_manager
 from parsers.base import ParseContext
 
+try:
+    import orjson as _fastjson
+
+    def _load_json_bytes(path: str) -> Any:
+        with open(path, "rb") as f:
+            return _fastjson.loads(f.read())
+except ImportError:
+    def _load_json_bytes(path: str) -> Any:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+# Caminhos de abas já vêm normalizados: o hit rate é praticamente 100% por sessão.
+_basename = functools.lru_cache(maxsize=1024)(os.path.basename)
+
+
+def _abs(p: str) -> str:
+    # abspath() chama getcwd() mesmo quando o caminho já é absoluto (caso comum
+    # a partir do segundo save, já que _load_project normaliza).
+    p = p.strip()
+    if not p:
+        return p
+    return p if os.path.isabs(p) else os.path.abspath(p)
+
 
 class ProjectMixin:
     def _remember_last_project(self, project_path: str) -> None:
@@ -49,28 +73,54 @@ class ProjectMixin:
             p = (project_path or "").strip()
             if not p:
                 return
-            self._settings().setValue("last_project_path", os.path.abspath(p))
-        except Exception:
-            pass
+            p = os.path.abspath(p)
+            s = self._settings()
+            current = s.value("last_project_path", "")
+            if (str(current) if current else "").strip() == p:
+                return
+            s.setValue("last_project_path", p)
+        except (OSError, TypeError):
+            return
+
+        # Agrupa o flush (registro/plist) em no máximo um sync() a cada 500ms,
+        # mesmo com aberturas de projeto em sequência.
+        if not getattr(self, "_settings_dirty", False):
+            self._settings_dirty = True
+            QTimer.singleShot(500, self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        self._settings_dirty = False
+        # QSettings.sync() não lança: falha de escrita só aparece em status(),
+        # e o valor continua em memória para o próximo sync.
+        self._settings().sync()
 
     def _get_last_project(self) -> str:
+        v = self._settings().value("last_project_path", "")
         try:
-            v = self._settings().value("last_project_path", "")
             return (str(v) if v else "").strip()
-        except Exception:
+        except TypeError:
             return ""
 
     def _normalize_project_paths(self, project: dict) -> dict:
-        pp = (project.get("project_path") or "").strip()
+        pp = _abs(project.get("project_path") or "")
         if pp:
-            project["project_path"] = os.path.abspath(pp)
+            project["project_path"] = pp
 
-        rp = (project.get("root_path") or "").strip()
+        rp = _abs(project.get("root_path") or "")
         if rp:
-            project["root_path"] = os.path.abspath(rp)
+            project["root_path"] = rp
 
         return project
 
+    @staticmethod
+    def _is_same_project(old: dict | None, new: dict | None) -> bool:
+        if not old or not new:
+            return False
+        if sync_service.compute_project_id(old) != sync_service.compute_project_id(new):
+            return False
+        return os.path.normcase(old.get("project_path") or "") == os.path.normcase(new.get("project_path") or "")
+
+    @Slot()
     def _open_project(self):
         from views.dialogs.open_project_dialog import OpenProjectDialog
 
@@ -79,6 +129,7 @@ class ProjectMixin:
             return
         self._load_project(dlg.project_path)
 
+    @Slot()
     def _create_project(self):
         from views.dialogs.create_project_dialog import CreateProjectDialog
 
@@ -87,19 +138,38 @@ class ProjectMixin:
             return
         self._load_project(dlg.project_path)
 
-    def _load_project(self, project_path: str):
+    def _load_project(self, project_path: str) -> bool:
         from services.local_project_service import LocalProjectService
 
         try:
             project = LocalProjectService(app_name=self.app_name).open_project(project_path)
         except Exception as e:
             QMessageBox.critical(self, "Erro", str(e))
-            return
+            return False
+
+        # Falha de dados depois da abertura (arquivo/pasta inacessível, JSON
+        # ou estado inválido, chave ausente) também é reportada aqui: quem
+        # chama só precisa olhar o retorno. Erro de programação propaga.
+        try:
+            self._apply_loaded_project(project, project_path)
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.critical(self, "Erro", f"Falha ao carregar o projeto:\n{e}")
+            return False
+        return True
 
+    def _apply_loaded_project(self, project: dict, project_path: str) -> None:
         project = self._normalize_project_paths(project)
 
+        # Reabrir o mesmo projeto mantém as abas (evita destruir/recriar os
+        # widgets); só o modelo da árvore e o cabeçalho são atualizados.
+        same_project = self._is_same_project(self.current_project, project)
+
         self.current_project = project
-        self._open_files.clear()
+        if not same_project:
+            self._open_files.clear()
+            # Padrões de busca do projeto anterior não servem mais.
+            from services.regex_cache import compile_cached
+            compile_cached.cache_clear()
 
         self.tree_header.setText(project.get("name", "Projeto"))
 
@@ -108,7 +178,8 @@ class ProjectMixin:
         self.tree.setRootIndex(src_index)
         self.tree.setEnabled(True)
 
-        self.tabs.clear()
+        if not same_project:
+            self.tabs.clear()
         self._refresh_project_state()
         self._refresh_tree_progress()
 
@@ -130,11 +201,11 @@ class ProjectMixin:
             if not os.path.exists(pj):
                 return
 
-        try:
-            self._load_project(project_path)
-        except Exception:
-            pass
+        # _load_project reporta as falhas de carregamento (abertura ou dados
+        # do projeto/estado) num diálogo e devolve False.
+        self._load_project(project_path)
 
+    @Slot()
     def _open_project_settings(self):
         import copy
         from PySide6.QtWidgets import QMessageBox
@@ -175,37 +246,64 @@ class ProjectMixin:
         finally:
             self._project_settings_dlg = None
     def _refresh_project_state(self):
+        # Coalesce rajadas (load/save/troca de aba/sync) num único refresh.
+        if getattr(self, "_refresh_pending", False):
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._refresh_pending = False
+        self._do_refresh_project_state()
+
+    @staticmethod
+    def _set_action_enabled(action, want: bool) -> None:
+        # setEnabled() emite changed mesmo sem mudança de estado.
+        if action.isEnabled() != want:
+            action.setEnabled(want)
+
+    def _do_refresh_project_state(self):
         has_project = self.current_project is not None
         has_tab = self._current_file_tab() is not None
         logged_in = bool(self.api_token)
+        _set = self._set_action_enabled
 
         # "Salvar Projeto" deve ficar disponível mesmo sem abas abertas.
         # Caso contrário, dá a impressão de que o projeto/configurações não salvam.
-        self.action_save_project.setEnabled(has_project)
-        self.action_export_file.setEnabled(has_project and has_tab)
-        self.action_export_batch.setEnabled(has_project)
-
-        self.action_undo.setEnabled(has_tab)
-        self.action_redo.setEnabled(has_tab)
-
-        try:
-            self.action_search.setEnabled(has_tab or has_project)
-        except Exception:
-            pass
-
-        self.action_translate_ai.setEnabled(has_project and has_tab and logged_in and self._ai_thread is None)
-        self.action_open_qa.setEnabled(has_project)
-        self.action_glossary.setEnabled(True)
-        self.action_tm.setEnabled(True)
-
-        try:
-            self.action_project_settings.setEnabled(has_project)
-        except Exception:
-            pass
-
+        _set(self.action_save_project, has_project)
+        _set(self.action_export_file, has_project and has_tab)
+        _set(self.action_export_batch, has_project)
+
+        _set(self.action_undo, has_tab)
+        _set(self.action_redo, has_tab)
+
+        if self._has_action_search:
+            _set(self.action_search, has_tab or has_project)
+
+        _set(self.action_translate_ai, has_project and has_tab and logged_in and self._ai_thread is None)
+        _set(self.action_open_qa, has_project)
+        _set(self.action_glossary, True)
+        _set(self.action_tm, True)
+
+        if self._has_action_project_settings:
+            _set(self.action_project_settings, has_project)
+
+    def _sync_message(self, icon, title: str, text: str) -> None:
+        # Reaproveita um QMessageBox por severidade (evita recriar HWNDs nativos
+        # a cada exportação/importação).
+        attr = "_msg_err" if icon == QMessageBox.Critical else "_msg_info"
+        box = getattr(self, attr, None)
+        if box is None:
+            box = QMessageBox(icon, "", "", QMessageBox.Ok, self)
+            setattr(self, attr, box)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+
+    @Slot()
     def _export_sync(self):
         if not self.current_project:
-            QMessageBox.information(self, "Sincronização", "Nenhum projeto aberto.")
+            self._sync_message(QMessageBox.Information, "Sincronização", "Nenhum projeto aberto.")
             return
 
         payload = sync_service.export_sync_snapshot(self.current_project)
@@ -218,19 +316,20 @@ class ProjectMixin:
         )
         if not path:
             return
-        if not (path.lower().endswith(".json")):
+        if os.path.splitext(path)[1].lower() != ".json":
             path += ".sekai-sync.json"
 
         try:
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
-            QMessageBox.information(self, "Sincronização", f"Exportado com sucesso:\n{path}")
+            self._sync_message(QMessageBox.Information, "Sincronização", f"Exportado com sucesso:\n{path}")
         except Exception as e:
-            QMessageBox.critical(self, "Erro", str(e))
+            self._sync_message(QMessageBox.Critical, "Erro", str(e))
 
+    @Slot()
     def _import_sync(self):
         if not self.current_project:
-            QMessageBox.information(self, "Sincronização", "Nenhum projeto aberto.")
+            self._sync_message(QMessageBox.Information, "Sincronização", "Nenhum projeto aberto.")
             return
 
         path, _ = QFileDialog.getOpenFileName(
@@ -243,16 +342,15 @@ class ProjectMixin:
             return
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = _load_json_bytes(path)
         except Exception as e:
-            QMessageBox.critical(self, "Erro", str(e))
+            self._sync_message(QMessageBox.Critical, "Erro", str(e))
             return
 
         try:
             report = sync_service.import_sync_snapshot(self.current_project, payload)
         except Exception as e:
-            QMessageBox.critical(self, "Erro", str(e))
+            self._sync_message(QMessageBox.Critical, "Erro", str(e))
             return
 
         msg = f"Aplicadas: {report.applied}\nIgnoradas (mais antigas): {report.skipped_older}\nConflitos: {len(report.conflicts)}"
@@ -268,20 +366,31 @@ class ProjectMixin:
             except Exception:
                 pass
 
-        QMessageBox.information(self, "Sincronização", msg)
-
-        self._refresh_open_tabs_from_state()
+        self._sync_message(QMessageBox.Information, "Sincronização", msg)
 
-    def _refresh_open_tabs_from_state(self):
-        try:
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
-                if hasattr(tab, "load_project_state_if_exists") and getattr(tab, "file_path", None):
-                    tab.load_project_state_if_exists(self.current_project)
-        except Exception:
-            pass
+        # Nada aplicado => nenhum estado em disco mudou; evita reler cada aba.
+        if report.applied <= 0:
+            return
+        self._refresh_open_tabs_from_state(set(report.applied_paths))
+
+    def _refresh_open_tabs_from_state(self, applied_paths: set[str] | None = None):
+        wanted = None
+        if applied_paths is not None:
+            wanted = {os.path.normcase(os.path.abspath(p)) for p in applied_paths if p}
+        for i in range(self.tabs.count()):
+            tab = self.tabs.widget(i)
+            file_path = getattr(tab, "file_path", None)
+            if not (hasattr(tab, "load_project_state_if_exists") and file_path):
+                continue
+            if wanted is not None and os.path.normcase(os.path.abspath(file_path)) not in wanted:
+                continue
+            try:
+                tab.load_project_state_if_exists(self.current_project)
+            except (OSError, ValueError):
+                pass
         self._refresh_tree_progress()
 
+    @Slot()
     def _save_all_open_files_state(self):
         if not self.current_project:
             return
@@ -297,17 +406,28 @@ class ProjectMixin:
             QMessageBox.warning(self, "Salvar Projeto", f"Falha ao salvar project.json:\n\n{e}")
 
         errors: list[str] = []
-        for path, tab in list(self._open_files.items()):
+        errors_omitted = 0
+        # Snapshot só das chaves: salvar pode disparar sinais que fecham abas.
+        for path in tuple(self._open_files):
+            tab = self._open_files.get(path)
+            if tab is None:
+                continue
             try:
                 tab.save_project_state(self.current_project)
             except Exception as e:
-                errors.append(f"{os.path.basename(path)}: {e}")
+                # Só formata as mensagens que serão exibidas.
+                if len(errors) < 30:
+                    errors.append(f"{_basename(path)}: {e}")
+                else:
+                    errors_omitted += 1
 
         if errors:
+            if errors_omitted:
+                errors.append(f"... (+{errors_omitted})")
             QMessageBox.warning(
                 self,
                 "Salvar Projeto",
-                "Concluído com erros:\n\n" + "\n".join(errors[:30]),
+                "Concluído com erros:\n\n" + "\n".join(errors),
             )
         else:
             self.statusBar().showMessage("Projeto salvo", 2500)
\ No newline at end of file
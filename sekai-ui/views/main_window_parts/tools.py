@@ -1,43 +1,34 @@
 from __future__ import annotations
 
-import os
-import re
-from typing import Any, TYPE_CHECKING
-
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QMessageBox
-
-from views.file_tab import FileTab
-
-if TYPE_CHECKING:
-    from views.dialogs.search_dialog import SearchResult
-else:
-    SearchResult = Any
-
-from parsers.autodetect import select_parser
-from parsers.base import ParseContext
+from PySide6.QtCore import QObject, Slot
+from PySide6.QtWidgets import QMessageBox
 
 
 class ToolsMixin:
     # -------------------------
     # Dialogs / tools
     # -------------------------
+    @Slot()
     def _open_plugins(self):
         from views.dialogs.plugin_manager_dialog import PluginManagerDialog
         PluginManagerDialog(self).exec()
 
+    @Slot()
     def _open_qa(self):
         from views.dialogs.qa_dialog import QADialog
         QADialog(self).exec()
 
+    @Slot()
     def _open_glossary(self):
         from views.dialogs.glossary_dialog import GlossaryDialog
         GlossaryDialog(self).exec()
 
+    @Slot()
     def _open_tm(self):
         from views.dialogs.translation_memory_dialog import TranslationMemoryDialog
         TranslationMemoryDialog(self).exec()
 
+    @Slot()
     def _open_about(self):
         msg = QMessageBox(self)
         msg.setWindowTitle("Sobre")
@@ -50,6 +41,7 @@ class ToolsMixin:
         if msg.clickedButton() == btn_check:
             self._check_updates_now()
 
+    @Slot()
     def _open_preferences(self):
         from views.dialogs.preferences_dialog import PreferencesDialog
 
@@ -61,6 +53,7 @@ class ToolsMixin:
         except Exception:
             pass
 
+    @Slot()
     def _open_search(self):
         """Abre o diálogo de busca (Ctrl+F)."""
         from views.dialogs.search_dialog import SearchDialog
@@ -86,232 +79,10 @@ class ToolsMixin:
 
         dlg.exec()
 
-    # -------------------------
-    # Replace helpers
-    # -------------------------
-    def _replace_all_in_open_tab(self, tab: FileTab, rx: re.Pattern, repl: str) -> int:
-        entries = getattr(tab, "_entries", []) or []
-        changed_rows: list[int] = []
-        before: list[dict] = []
-        after: list[dict] = []
-        total_replacements = 0
-
-        for i, e in enumerate(entries):
-            if not isinstance(e, dict):
-                continue
-
-            old_v = self._entry_translation_text(e)
-            if not isinstance(old_v, str) or not old_v:
-                continue
-
-            new_v, n = rx.subn(repl, old_v)
-            if n <= 0 or new_v == old_v:
-                continue
-
-            total_replacements += int(n)
-            changed_rows.append(i)
-            before.append({"translation": old_v, "status": e.get("status") or "untranslated"})
-            e["translation"] = new_v
-            after.append({"translation": new_v, "status": e.get("status") or "untranslated"})
-
-        if not changed_rows:
-            return 0
-
-        # depende do seu FileTab ter essas APIs
-        tab.record_undo_for_rows(changed_rows, before=before, after=after)
-        tab.set_dirty(True)
-
-        for r in changed_rows:
-            vr = tab._visible_row_from_source_row(r)
-            if vr is not None:
-                tab.model.refresh_row(vr)
-
-        tab._refresh_editor_from_selection()
-        self._update_tab_title(tab)
-        return total_replacements
-
-    def _replace_all_in_project(self, rx: re.Pattern, repl: str) -> int:
-        if not self.current_project:
-            return 0
-
-        root = (self.current_project.get("root_path") or "").strip()
-        if not root or not os.path.isdir(root):
-            return 0
-
-        supported = self._supported_extensions()
-
-        # hint apenas (entrada real deve ser detectada por arquivo)
-        hint_encoding = (self.current_project.get("encoding") or "utf-8").strip() or "utf-8"
-        if hint_encoding.lower() == "auto":
-            hint_encoding = "utf-8"
-
-        total_replacements = 0
-
-        from services.encoding_service import EncodingService
-        from models import project_state_store
-
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            for base, dirs, files in os.walk(root):
-                dirs[:] = [d for d in dirs if d.lower() != "exports"]
-
-                for fn in files:
-                    ext = os.path.splitext(fn)[1].lower()
-                    if ext and supported and ext not in supported:
-                        continue
-
-                    path = os.path.join(base, fn)
-                    if not self._is_openable_candidate(path):
-                        continue
-
-                    abs_path = os.path.abspath(path)
-
-                    # Se já estiver aberto, opera em memória (inclui não-salvo)
-                    tab = self._open_files.get(abs_path)
-                    if tab is not None:
-                        total_replacements += int(self._replace_all_in_open_tab(tab, rx, repl) or 0)
-                        continue
-
-                    # --- ler bytes + detectar encoding original do arquivo ---
-                    try:
-                        st = project_state_store.load_file_state(self.current_project, abs_path)
-                        state_encoding = (getattr(st, "encoding", "") or "").strip()
-                    except Exception:
-                        st = None
-                        state_encoding = ""
-
-                    try:
-                        raw = EncodingService.read_bytes(abs_path)
-                    except Exception:
-                        continue
-
-                    def _try_decode(enc: str) -> str | None:
-                        try:
-                            raw.decode(enc, errors="strict")
-                            return enc
-                        except Exception:
-                            return None
-
-                    bom_first: list[str] = []
-                    if raw.startswith(b"\xef\xbb\xbf"):
-                        bom_first.append("utf-8-sig")
-                    elif raw.startswith(b"\xff\xfe") or raw.startswith(b"\xfe\xff"):
-                        bom_first.append("utf-16")
-
-                    candidates: list[str] = []
-                    for e in [
-                        state_encoding,
-                        *bom_first,
-                        hint_encoding,
-                        "utf-8",
-                        "utf-8-sig",
-                        "cp932",
-                        "shift_jis",
-                        "windows-1252",
-                    ]:
-                        e = (e or "").strip()
-                        if e and e not in candidates:
-                            candidates.append(e)
-
-                    chosen = ""
-                    for enc in candidates:
-                        if _try_decode(enc):
-                            chosen = enc
-                            break
-                    if not chosen:
-                        chosen = hint_encoding
-
-                    decoded = EncodingService.decode_bytes(raw, chosen, errors="replace")
-                    text = decoded.text or ""
-
-                    # --- parse ---
-                    try:
-                        parser = select_parser(self.current_project, abs_path, text)
-                        try:
-                            ctx = ParseContext(
-                                file_path=abs_path,
-                                project=self.current_project,
-                                original_text=text,
-                                encoding=chosen,
-                                options={"newline_style": decoded.newline_style, "had_bom": decoded.had_bom},
-                            )
-                        except TypeError:
-                            ctx = ParseContext(file_path=abs_path, project=self.current_project)
-
-                        entries = parser.parse(ctx, text)
-                    except Exception:
-                        continue
-
-                    # --- aplicar estado salvo (tradução/status) se existir ---
-                    try:
-                        if st and getattr(st, "entries", None):
-                            by_id: dict[str, dict] = {}
-                            for se in st.entries:
-                                if not isinstance(se, dict):
-                                    continue
-                                se_eid = se.get("entry_id")
-                                if se_eid is None:
-                                    continue
-                                by_id[str(se_eid)] = se
-
-                            if by_id:
-                                for ce in entries:
-                                    if not isinstance(ce, dict):
-                                        continue
-                                    eid = ce.get("entry_id")
-                                    key = str(eid) if eid is not None else ""
-                                    if key and key in by_id:
-                                        se = by_id[key]
-                                        if "translation" in se:
-                                            ce["translation"] = se.get("translation") or ""
-                                        if "status" in se:
-                                            ce["status"] = se.get("status") or "untranslated"
-                    except Exception:
-                        pass
-
-                    # --- replace ---
-                    changed_any = False
-                    for e in entries:
-                        if not isinstance(e, dict):
-                            continue
-                        old_v = self._entry_translation_text(e)
-                        if not isinstance(old_v, str) or not old_v:
-                            continue
-                        new_v, n = rx.subn(repl, old_v)
-                        if n > 0 and new_v != old_v:
-                            e["translation"] = new_v
-                            total_replacements += int(n)
-                            changed_any = True
-
-                    # --- salvar estado do arquivo (não exporta arquivo final aqui) ---
-                    if changed_any:
-                        try:
-                            # mantém encoding original detectado
-                            project_state_store.save_file_state(
-                                self.current_project,
-                                abs_path,
-                                entries,
-                                encoding=chosen,
-                                newline_style=decoded.newline_style,
-                                had_bom=decoded.had_bom,
-                            )
-                        except TypeError:
-                            # compat com assinatura antiga
-                            try:
-                                project_state_store.save_file_state(self.current_project, abs_path, entries)
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-        finally:
-            QApplication.restoreOverrideCursor()
-
-        return total_replacements
-
-    
     # -------------------------
     # AI Translate
     # -------------------------
+    @Slot()
     def _translate_current_file_with_ai(self) -> None:
         """
         Tradução com IA para as linhas selecionadas no arquivo atual.
@@ -397,20 +168,20 @@ class ToolsMixin:
         # 1) se a model expõe "entries" (lista visível), use identidade do dict para achar no vetor fonte (tab._entries)
         # 2) fallback para tab._source_row_from_visible_row (model.visible_row_to_source_row)
         entries = getattr(tab, "_entries", []) or []
+        # id(dict) -> source row, montado uma vez (evita O(V·N) ao varrer entries por linha).
+        id_to_src = {id(e): i for i, e in enumerate(entries)}
+        vis_entries = getattr(getattr(tab, "model", None), "entries", None)
+        seen_rows: set[int] = set()
 
         for vr in visible_rows:
             sr: int | None = None
 
             # (1) identidade do dict (mais confiável quando entry_id/line_number não são únicos)
             try:
-                vis_entries = getattr(getattr(tab, "model", None), "entries", None)
                 if isinstance(vis_entries, list) and 0 <= vr < len(vis_entries):
                     ve = vis_entries[vr]
                     if isinstance(ve, dict):
-                        for i, e in enumerate(entries):
-                            if e is ve:
-                                sr = i
-                                break
+                        sr = id_to_src.get(id(ve))
             except Exception:
                 sr = None
 
@@ -421,7 +192,8 @@ class ToolsMixin:
                 except Exception:
                     sr = None
 
-            if isinstance(sr, int) and 0 <= sr < len(entries) and sr not in source_rows:
+            if isinstance(sr, int) and 0 <= sr < len(entries) and sr not in seen_rows:
+                seen_rows.add(sr)
                 source_rows.append(sr)
 
         if not source_rows:
@@ -457,6 +229,9 @@ class ToolsMixin:
         preview_rows: list[dict] = []
         # id -> original (fallback quando o proxy não retornar tradução para algum item)
         orig_by_id: dict[str, str] = {}
+        # (source row, item_id) na mesma ordem de preview_rows; reaproveitado
+        # no _on_finished em vez de recalcular o id por linha.
+        row_to_item_id: list[tuple[int, str]] = []
 
         for r in source_rows:
             e = entries[r] if 0 <= r < len(entries) else None
@@ -474,6 +249,7 @@ class ToolsMixin:
             orig_by_id[item_id] = original
             items.append({"id": item_id, "text": original})
             preview_rows.append({"row": r, "original": original, "translation": ""})
+            row_to_item_id.append((r, item_id))
 
         if not items:
             QMessageBox.information(self, "IA", "Nenhuma linha traduzível na seleção.")
@@ -507,6 +283,10 @@ class ToolsMixin:
             payload=payload,
             timeout=60.0,
             chunk_size=1,
+            use_orjson=True,
+            concurrency=8,
+            # opcional (httpx[http2] não é dependência): desligado por padrão
+            http2=bool(self._settings().value("ai/http2", False, type=bool)),
         )
         worker.moveToThread(thread)
 
@@ -604,12 +384,9 @@ class ToolsMixin:
                     pass
 
             # preencher preview_rows
-            for pr in preview_rows:
-                row = pr.get("row")
-                e = entries[row] if isinstance(row, int) and 0 <= row < len(entries) else None
-                if isinstance(e, dict):
-                    item_id = str(e.get("entry_id") or e.get("id") or row)
-                    pr["translation"] = by_id.get(item_id, "")
+            by_id_get = by_id.get
+            for pr, (_row, item_id) in zip(preview_rows, row_to_item_id):
+                pr["translation"] = by_id_get(item_id, "")
 
             from views.dialogs.translation_preview_dialog import TranslationPreviewDialog
 
@@ -624,19 +401,18 @@ class ToolsMixin:
             if not getattr(dlg, "confirmed", False):
                 return
 
+            try:
+                tab.flush_pending_edits()
+            except Exception:
+                pass
             before_snap: list[dict] = tab.snapshot_rows(list(source_rows))
             changed_rows: list[int] = []
 
-            for row in source_rows:
-                if not (0 <= row < len(entries)):
-                    continue
-                e = entries[row]
-                if not isinstance(e, dict):
-                    continue
-                item_id = str(e.get("entry_id") or e.get("id") or row)
-                tr = by_id.get(item_id, "")
+            for row, item_id in row_to_item_id:
+                tr = by_id_get(item_id, "")
                 if not isinstance(tr, str) or tr.strip() == "":
                     continue
+                e = entries[row]
                 e["translation"] = tr
                 e["status"] = "in_progress"   # <- aqui
                 changed_rows.append(row)
@@ -654,14 +430,29 @@ class ToolsMixin:
                             if callable(_orig_refresh_row):
                                 tab.model.refresh_row = _orig_refresh_row  # type: ignore
 
-                        # um repaint único para toda a tabela visível
+                        # repaint só das faixas contíguas de linhas alteradas
+                        # (em vez da tabela inteira)
                         try:
-                            rc = tab.model.rowCount()
                             cc = tab.model.columnCount()
-                            if rc > 0 and cc > 0:
-                                left = tab.model.index(0, 0)
-                                right = tab.model.index(rc - 1, cc - 1)
-                                tab.model.dataChanged.emit(left, right)
+                            vrows = sorted(
+                                vr for vr in (tab._visible_row_from_source_row(r) for r in changed_rows)
+                                if vr is not None
+                            )
+                            if cc > 0 and vrows:
+                                def _emit(start: int, end: int) -> None:
+                                    tab.model.dataChanged.emit(
+                                        tab.model.index(start, 0),
+                                        tab.model.index(end, cc - 1),
+                                    )
+
+                                cur_start = cur_end = vrows[0]
+                                for vr in vrows[1:]:
+                                    if vr == cur_end + 1:
+                                        cur_end = vr
+                                    elif vr != cur_end:
+                                        _emit(cur_start, cur_end)
+                                        cur_start = cur_end = vr
+                                _emit(cur_start, cur_end)
                         except Exception:
                             pass
                     else:
@@ -679,8 +470,6 @@ class ToolsMixin:
                 pass
 
         # Bridge QObject: garante que callbacks rodam na UI thread (evita travar ao abrir dialogs)
-        from PySide6.QtCore import QObject, Slot
-
         class _AIBridge(QObject):
             @Slot(int, int)
             def on_progress(self, done: int, total: int) -> None:
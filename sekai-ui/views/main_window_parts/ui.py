@@ -4,12 +4,13 @@ import os
 from pathlib import Path
 import json
 import copy
+import functools
 import re
 import time
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import Qt, QSettings, QThread, QTimer, QObject, Signal
-from PySide6.QtGui import QKeySequence
+from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -45,9 +46,71 @@ from parsers.manager import get_parser_manager
 from parsers.base import ParseContext
 
 
+@functools.lru_cache(maxsize=None)
+def _key_sequence(spec) -> QKeySequence:
+    """QKeySequence (texto ou StandardKey) criado uma vez; só chamado depois
+    do QApplication existir, quando os atalhos padrão já resolvem."""
+    return QKeySequence(spec)
+
+
 class UIMixin:
+    # (título, atributo do menu, lazy, método chamado após montar, itens)
+    # item: (atributo da action, texto, método, atalho, atalho global) ou None = separador
+    _MENU_SPEC = (
+        ("Arquivo", None, False, None, (
+            ("action_open_project", "Abrir Projeto", "_open_project", None, False),
+            ("action_create_project", "Criar Projeto", "_create_project", None, False),
+            None,
+            ("action_project_settings", "Configurações do Projeto...", "_open_project_settings", "Ctrl+,", False),
+            ("action_export_sync", "Exportar Sincronização...", "_export_sync", None, False),
+            ("action_import_sync", "Importar Sincronização...", "_import_sync", None, False),
+            None,
+            ("action_save_project", "Salvar Projeto (Todos Abertos)", "_save_all_open_files_state", None, False),
+            None,
+            ("action_export_file", "Exportar Arquivo", "_export_current_file", None, False),
+            ("action_export_batch", "Exportar Projeto (Lote)", "_export_project_batch", None, False),
+            None,
+            ("action_exit", "Sair", "close", None, False),
+        )),
+        ("Editar", None, False, None, (
+            ("action_undo", "Desfazer", "_undo_current", QKeySequence.Undo, True),
+            ("action_redo", "Refazer", "_redo_current", "Ctrl+Shift+Z", True),
+            None,
+            ("action_search", "Buscar...", "_open_search", QKeySequence.Find, True),
+        )),
+        ("Ferramentas", None, False, None, (
+            ("action_translate_ai", "Traduzir com IA (Linhas Selecionadas)", "_translate_current_file_with_ai", None, False),
+            None,
+            ("action_open_qa", "QA (Arquivo / Projeto)", "_open_qa", None, False),
+            None,
+            ("action_glossary", "Glossário", "_open_glossary", None, False),
+            ("action_tm", "Memória de Tradução", "_open_tm", None, False),
+        )),
+        ("Extensões", None, True, None, (
+            ("action_plugins", "Gerenciar Extensões", "_open_plugins", None, False),
+        )),
+        ("Preferências", None, True, None, (
+            ("action_prefs", "Configurações...", "_open_preferences", None, False),
+        )),
+        ("Ajuda", None, True, None, (
+            ("action_about", "Sobre", "_open_about", None, False),
+            ("action_check_updates", "Verificar atualizações...", "_check_updates_now", None, False),
+        )),
+        ("Conta", "account_menu", True, "_refresh_account_menu", (
+            ("action_login", "Login", "_login", None, False),
+            ("action_logout", "Logout", "_logout", None, False),
+        )),
+    )
+
     def _settings(self) -> QSettings:
-        return QSettings(self.app_name, self.app_name)
+        # Instância única por janela (criada em MainWindow.__init__); QSettings
+        # do mesmo processo compartilham o cache, então diálogos continuam vendo
+        # as mesmas chaves.
+        s = getattr(self, "_settings_cached", None)
+        if s is None:
+            s = QSettings(self.app_name, self.app_name)
+            self._settings_cached = s
+        return s
 
     def _apply_saved_theme(self) -> None:
         app = QApplication.instance()
@@ -198,6 +261,8 @@ class UIMixin:
             cached = self._live_tree_progress_cache.get(path)
             if cached and cached[0] == rev:
                 return {'signature': rev, 'progress': cached[1]}
+            if hasattr(tab, 'flush_pending_edits'):
+                tab.flush_pending_edits()
             entries = getattr(tab, '_entries', None) or []
             from services.file_progress_service import compute_entries_progress
             done, total, percent = compute_entries_progress(entries)
@@ -250,7 +315,8 @@ class UIMixin:
             live_progress_getter=self._live_tree_progress_payload,
             parent=self,
         )
-        self.fs_model.setRootPath("")
+        # Sem rootPath aqui: a árvore fica vazia/desabilitada até _load_project
+        # apontar para a pasta do projeto.
 
         self.tree = QTreeView()
         self.tree.setModel(self.fs_model)
@@ -260,9 +326,6 @@ class UIMixin:
         self.tree.setMaximumWidth(400)
         self.tree.setEnabled(False)
 
-        for i in range(1, 4):
-            self.tree.hideColumn(i)
-
         self.tree.doubleClicked.connect(self._on_tree_double_clicked)
 
         tree_layout.addWidget(self.tree)
@@ -283,78 +346,60 @@ class UIMixin:
     def _build_menu(self):
         menubar = self.menuBar()
 
-        file_menu = menubar.addMenu("Arquivo")
-        self.action_open_project = file_menu.addAction("Abrir Projeto", self._open_project)
-        self.action_create_project = file_menu.addAction("Criar Projeto", self._create_project)
-
-        file_menu.addSeparator()
-        self.action_project_settings = file_menu.addAction(
-            "Configurações do Projeto...",
-            self._open_project_settings,
-        )
-        self.action_project_settings.setShortcut(QKeySequence("Ctrl+,"))
-
-        self.action_export_sync = file_menu.addAction(
-            "Exportar Sincronização...",
-            self._export_sync,
-        )
-        self.action_import_sync = file_menu.addAction(
-            "Importar Sincronização...",
-            self._import_sync,
-        )
-
-        file_menu.addSeparator()
-        self.action_save_project = file_menu.addAction(
-            "Salvar Projeto (Todos Abertos)",
-            self._save_all_open_files_state,
-        )
-        file_menu.addSeparator()
-        self.action_export_file = file_menu.addAction("Exportar Arquivo", self._export_current_file)
-        self.action_export_batch = file_menu.addAction("Exportar Projeto (Lote)", self._export_project_batch)
-        file_menu.addSeparator()
-        self.action_exit = file_menu.addAction("Sair", self.close)
-
-        edit_menu = menubar.addMenu("Editar")
-
-        self.action_undo = edit_menu.addAction("Desfazer", self._undo_current)
-        self.action_undo.setShortcut(QKeySequence.Undo)
-        self.action_undo.setShortcutContext(Qt.ApplicationShortcut)
-
-        self.action_redo = edit_menu.addAction("Refazer", self._redo_current)
-        self.action_redo.setShortcut(QKeySequence("Ctrl+Shift+Z"))
-        self.action_redo.setShortcutContext(Qt.ApplicationShortcut)
-
-        edit_menu.addSeparator()
-        self.action_search = edit_menu.addAction("Buscar...", self._open_search)
-        self.action_search.setShortcut(QKeySequence.Find)
-        self.action_search.setShortcutContext(Qt.ApplicationShortcut)
-
-        tools_menu = menubar.addMenu("Ferramentas")
-
-        self.action_translate_ai = tools_menu.addAction(
-            "Traduzir com IA (Linhas Selecionadas)",
-            self._translate_current_file_with_ai,
-        )
-        tools_menu.addSeparator()
-        self.action_open_qa = tools_menu.addAction("QA (Arquivo / Projeto)", self._open_qa)
-        tools_menu.addSeparator()
-        self.action_glossary = tools_menu.addAction("Glossário", self._open_glossary)
-        self.action_tm = tools_menu.addAction("Memória de Tradução", self._open_tm)
-
-        plugins_menu = menubar.addMenu("Extensões")
-        self.action_plugins = plugins_menu.addAction("Gerenciar Extensões", self._open_plugins)
-
-        prefs_menu = menubar.addMenu("Preferências")
-        self.action_prefs = prefs_menu.addAction("Configurações...", self._open_preferences)
-
-        help_menu = menubar.addMenu("Ajuda")
-        self.action_about = help_menu.addAction("Sobre", self._open_about)
-        self.action_check_updates = help_menu.addAction("Verificar atualizações...", self._check_updates_now)
+        # Todas as actions são criadas aqui (auth/updates usam antes de o menu
+        # abrir); menus raros (lazy=True) só recebem as actions na primeira
+        # abertura. Atalhos globais ficam em Arquivo/Editar, montados aqui.
+        self._menu_built: set[str] = set()
+
+        for title, menu_attr, lazy, after, items in self._MENU_SPEC:
+            menu = menubar.addMenu(title)
+            if menu_attr:
+                setattr(self, menu_attr, menu)
+            actions = self._create_menu_actions(items)
+            if lazy:
+                self._lazy_menu(menu, title, actions, after)
+            else:
+                self._add_menu_items(menu, actions)
+
+        # Resolvido uma vez aqui; _do_refresh_project_state só lê as flags.
+        self._has_action_search = hasattr(self, "action_search")
+        self._has_action_project_settings = hasattr(self, "action_project_settings")
+
+    def _create_menu_actions(self, items) -> list[QAction | None]:
+        """Cria (sem menu) as actions dos itens; None = separador."""
+        actions: list[QAction | None] = []
+        for item in items:
+            if item is None:
+                actions.append(None)
+                continue
+            attr, text, slot, shortcut, app_wide = item
+            action = QAction(text, self)
+            action.triggered.connect(getattr(self, slot))
+            if shortcut is not None:
+                action.setShortcut(_key_sequence(shortcut))
+                if app_wide:
+                    action.setShortcutContext(Qt.ApplicationShortcut)
+            setattr(self, attr, action)
+            actions.append(action)
+        return actions
+
+    def _add_menu_items(self, menu, actions) -> None:
+        for action in actions:
+            if action is None:
+                menu.addSeparator()
+            else:
+                menu.addAction(action)
 
-        self.account_menu = menubar.addMenu("Conta")
-        self.action_login = self.account_menu.addAction("Login", self._login)
-        self.action_logout = self.account_menu.addAction("Logout", self._logout)
+    def _lazy_menu(self, menu, title: str, actions, after: str | None = None) -> None:
+        menu.aboutToShow.connect(functools.partial(self._populate_menu_once, menu, title, actions, after))
 
+    def _populate_menu_once(self, menu, title: str, actions, after: str | None = None) -> None:
+        if title in self._menu_built:
+            return
+        self._menu_built.add(title)
+        self._add_menu_items(menu, actions)
+        if after:
+            getattr(self, after)()
 
     def _build_status_bar(self):
         self.statusBar().showMessage("Pronto")
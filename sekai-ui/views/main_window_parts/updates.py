@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QThread, QThreadPool, Qt, Signal, Slot
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 from services.update_service import GitHubReleaseUpdater
@@ -14,6 +15,10 @@ else:
     SearchResult = Any
 
 
+# Intervalo mínimo entre emissões de progresso do download.
+_PROGRESS_MIN_INTERVAL_NS = 50_000_000
+
+
 class _UpdateWorker(QObject):
     progress = Signal(int)
     failed = Signal(str)
@@ -25,11 +30,16 @@ class _UpdateWorker(QObject):
         self._info = info
         self._cancel = False
 
+    @Slot()
     def cancel(self) -> None:
         self._cancel = True
 
+    @Slot()
     def run(self) -> None:
         try:
+            self._last_pct = -1
+            self._last_emit_ns = 0
+
             def _progress(pct):
                 try:
                     pct = int(pct)
@@ -41,6 +51,15 @@ class _UpdateWorker(QObject):
                 elif pct > 100:
                     pct = 100
 
+                # Coalesce: só emite quando o % muda e no máximo a cada ~50 ms
+                # (o 100 final sempre passa).
+                if pct == self._last_pct:
+                    return
+                now = time.monotonic_ns()
+                if pct < 100 and now - self._last_emit_ns < _PROGRESS_MIN_INTERVAL_NS:
+                    return
+                self._last_pct = pct
+                self._last_emit_ns = now
                 self.progress.emit(pct)
 
             self._svc.download_and_install(
@@ -59,26 +78,143 @@ class _UpdateWorker(QObject):
             self.failed.emit(str(e))
 
 
+class _UpdateBridge(QObject):
+    """Recebe os sinais do _UpdateWorker na UI thread (slots declarados)."""
+
+    def __init__(self, on_failed, on_finished, parent=None):
+        super().__init__(parent)
+        self._on_failed = on_failed
+        self._on_finished = on_finished
+
+    @Slot(str)
+    def on_failed(self, msg: str) -> None:
+        self._on_failed(msg)
+
+    @Slot()
+    def on_finished(self) -> None:
+        self._on_finished()
+
+
+class _UpdateCheckWorker(QObject):
+    """fetch_latest() (HTTPS para o GitHub) fora da UI thread."""
+
+    finished = Signal(object, str, str)  # UpdateInfo | None, título, mensagem
+    failed = Signal(str)
+
+    def __init__(self, update_service: GitHubReleaseUpdater, app_version: str, max_notes_len: int):
+        super().__init__()
+        self._svc = update_service
+        self._app_version = app_version
+        self._max_notes_len = max_notes_len
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            info = self._svc.fetch_latest()
+            title, body = ("", "")
+            if info:
+                # mensagem montada aqui: a UI thread não mexe no corpo das notas
+                title, body = UpdatesMixin._format_update_message(info, self._app_version, self._max_notes_len)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(info, title, body)
+
+
+class _UpdateCheckBridge(QObject):
+    """Entrega o resultado do _UpdateCheckWorker na UI thread."""
+
+    def __init__(self, on_finished, on_failed, parent=None):
+        super().__init__(parent)
+        self._on_finished = on_finished
+        self._on_failed = on_failed
+
+    @Slot(object, str, str)
+    def on_finished(self, info, title: str, body: str) -> None:
+        self._on_finished(info, title, body)
+
+    @Slot(str)
+    def on_failed(self, msg: str) -> None:
+        self._on_failed(msg)
+
+
 class UpdatesMixin:
+    @staticmethod
+    def _format_update_message(info, app_version: str, max_notes_len: int) -> tuple[str, str]:
+        """(título, texto) da pergunta "Deseja baixar e instalar agora?"."""
+        details = (
+            f"Nova versão disponível: {info.version}\n"
+            f"Você está usando: {app_version}\n\n"
+        )
+
+        notes = (info.notes or "").strip()
+        if notes:
+            clipped = notes[:max_notes_len]
+            details += clipped + ("..." if len(clipped) < len(notes) else "") + "\n\n"
+
+        return "Atualização disponível", details + "Deseja baixar e instalar agora?"
+
     def _auto_check_updates(self):
+        self._start_update_check(self._on_auto_update_info, None, max_notes_len=1200)
+
+    @Slot()
+    def _check_updates_now(self):
+        if getattr(self, "_update_in_progress", False):
+            return
+        self._start_update_check(self._on_manual_update_info, self._on_manual_update_failed, max_notes_len=2000)
+
+    def _start_update_check(self, on_info, on_failed, *, max_notes_len: int) -> None:
+        """
+        Roda fetch_latest() numa QThread e chama on_info(info, título, texto) /
+        on_failed(msg) na UI.
+        """
+        if getattr(self, "_update_check_thread", None) is not None:
+            return
+        if not getattr(self, "update_service", None):
+            return
+
+        worker = _UpdateCheckWorker(self.update_service, str(self.app_version), max_notes_len)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+
+        def _cleanup() -> None:
+            self._update_check_thread = None
+            self._update_check_bridge = None
+            try:
+                thread.quit()
+            except Exception:
+                pass
+
+        def _finished(info, title: str, body: str) -> None:
+            _cleanup()
+            on_info(info, title, body)
+
+        def _failed(msg: str) -> None:
+            _cleanup()
+            if on_failed is not None:
+                on_failed(msg)
+
+        bridge = _UpdateCheckBridge(_finished, _failed, self)
+        # manter referências durante a execução (evita GC)
+        self._update_check_bridge = bridge
+        self._update_check_thread = thread
+
+        worker.finished.connect(bridge.on_finished, type=Qt.QueuedConnection)
+        worker.failed.connect(bridge.on_failed, type=Qt.QueuedConnection)
+        thread.started.connect(worker.run)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+
+    def _on_auto_update_info(self, info, title: str, body: str) -> None:
         try:
-            info = self.update_service.fetch_latest()
             if not info:
                 return
 
-            notes = (info.notes or "").strip()
-            details = (
-                f"Nova versão disponível: {info.version}\n"
-                f"Você está usando: {self.app_version}\n\n"
-            )
-
-            if notes:
-                details += notes[:1200] + ("..." if len(notes) > 1200 else "") + "\n\n"
-
             res = QMessageBox.question(
                 self,
-                "Atualização disponível",
-                details + "Deseja baixar e instalar agora?",
+                title,
+                body,
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.Yes,
             )
@@ -89,9 +225,8 @@ class UpdatesMixin:
         except Exception:
             return
 
-    def _check_updates_now(self):
+    def _on_manual_update_info(self, info, title: str, body: str) -> None:
         try:
-            info = self.update_service.fetch_latest()
             if not info:
                 QMessageBox.information(
                     self,
@@ -100,19 +235,10 @@ class UpdatesMixin:
                 )
                 return
 
-            notes = (info.notes or "").strip()
-            details = (
-                f"Nova versão disponível: {info.version}\n"
-                f"Você está usando: {self.app_version}\n\n"
-            )
-
-            if notes:
-                details += notes[:2000] + ("..." if len(notes) > 2000 else "") + "\n\n"
-
             res = QMessageBox.question(
                 self,
-                "Atualização disponível",
-                details + "Deseja baixar e instalar agora?",
+                title,
+                body,
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.Yes,
             )
@@ -121,13 +247,55 @@ class UpdatesMixin:
                 self._start_update_install(info)
 
         except Exception as e:
-            QMessageBox.critical(
+            self._on_manual_update_failed(str(e))
+
+    def _on_manual_update_failed(self, msg: str) -> None:
+        QMessageBox.critical(
+            self,
+            "Erro ao verificar atualizações",
+            msg,
+        )
+
+    def _update_install_dialog(self) -> ProgressDialog:
+        """ProgressDialog + bridge criados uma vez e reaproveitados a cada tentativa."""
+        dlg = getattr(self, "_update_dlg", None)
+        if dlg is None:
+            dlg = ProgressDialog(
+                title="Atualização",
+                message="Baixando atualização...",
+                parent=self,
+                cancellable=True,
+            )
+            dlg.canceled.connect(self._cancel_update_install)
+            self._update_dlg = dlg
+            self._update_bridge = _UpdateBridge(
+                self._on_update_install_failed,
+                self._on_update_install_finished,
                 self,
-                "Erro ao verificar atualizações",
-                str(e),
             )
+        return dlg
+
+    @Slot()
+    def _cancel_update_install(self) -> None:
+        worker = getattr(self, "_update_worker", None)
+        if worker is not None:
+            worker.cancel()
+
+    def _set_update_in_progress(self, active: bool) -> None:
+        self._update_in_progress = active
+        # o menu Ajuda é montado sob demanda: a action pode ainda não existir
+        action = getattr(self, "action_check_updates", None)
+        if action is not None:
+            try:
+                action.setEnabled(not active)
+            except Exception:
+                pass
 
     def _start_update_install(self, info) -> None:
+        # um download por vez: cliques repetidos não disparam outro worker
+        if getattr(self, "_update_in_progress", False):
+            return
+
         if not getattr(self, "update_service", None):
             QMessageBox.critical(
                 self,
@@ -136,71 +304,60 @@ class UpdatesMixin:
             )
             return
 
-        dlg = ProgressDialog(
-            title="Atualização",
-            message="Baixando atualização...",
-            parent=self,
-            cancellable=True,
-        )
-        dlg.set_total(100)
-        dlg.set_progress(0)
-        dlg.show()
-
-        worker = _UpdateWorker(self.update_service, info)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-
-        dlg.canceled.connect(worker.cancel)
-        worker.progress.connect(dlg.set_progress)
-
-        def _cleanup():
-            try:
-                thread.quit()
-            except Exception:
-                pass
-            try:
-                thread.wait(2000)
-            except Exception:
-                pass
+        self._set_update_in_progress(True)
+        started = False
+        try:
+            dlg = self._update_install_dialog()
+            dlg.set_message("Baixando atualização...")
+            dlg.set_total(100)
+            dlg.set_progress(0)
+            dlg.show()
+
+            # Worker fica na UI thread (recebe cancel); run() vai para o
+            # QThreadPool, sem QThread dedicada por tentativa.
+            worker = _UpdateWorker(self.update_service, info)
+            self._update_worker = worker
+
+            bridge = self._update_bridge
+            worker.progress.connect(dlg.set_progress, type=Qt.QueuedConnection)
+            worker.failed.connect(bridge.on_failed, type=Qt.QueuedConnection)
+            worker.finished.connect(bridge.on_finished, type=Qt.QueuedConnection)
+
+            QThreadPool.globalInstance().start(worker.run)
+            started = True
+        finally:
+            if not started:
+                self._finish_update_install()
+
+    def _finish_update_install(self) -> None:
+        self._set_update_in_progress(False)
+        worker = getattr(self, "_update_worker", None)
+        self._update_worker = None
+        if worker is not None:
             try:
                 worker.deleteLater()
             except Exception:
                 pass
-            try:
-                thread.deleteLater()
-            except Exception:
-                pass
-
-        def _on_failed(msg: str):
-            try:
-                dlg.close()
-            except Exception:
-                pass
-
-            _cleanup()
-
-            QMessageBox.critical(
-                self,
-                "Erro ao atualizar",
-                msg,
-            )
+        try:
+            self._update_dlg.hide()
+        except Exception:
+            pass
 
-        def _on_finished():
-            try:
-                dlg.close()
-            except Exception:
-                pass
+    def _on_update_install_failed(self, msg: str) -> None:
+        self._finish_update_install()
 
-            _cleanup()
+        QMessageBox.critical(
+            self,
+            "Erro ao atualizar",
+            msg,
+        )
 
-            QMessageBox.information(
-                self,
-                "Atualização",
-                "O instalador foi iniciado. O aplicativo será fechado para concluir a atualização.",
-            )
-            QApplication.quit()
+    def _on_update_install_finished(self) -> None:
+        self._finish_update_install()
 
-        worker.failed.connect(_on_failed)
-        worker.finished.connect(_on_finished)
-        thread.started.connect(worker.run)
-        thread.start()
\ No newline at end of file
+        QMessageBox.information(
+            self,
+            "Atualização",
+            "O instalador foi iniciado. O aplicativo será fechado para concluir a atualização.",
+        )
+        QApplication.quit()
@@ -1,5 +1,18 @@
+import array
+
 from PySide6.QtWidgets import QPlainTextEdit
-from PySide6.QtGui import QTextOption, QFont, QTextCursor
+from PySide6.QtGui import QTextOption, QFont, QTextCursor, QTextBlockFormat
+
+
+# Remove \r/\n: uma entry nunca vira mais de um bloco. Mesma regra do
+# TranslationEditor: só copia a linha quando há quebra.
+_NL_STRIP = str.maketrans("", "", "\r\n")
+
+
+def _norm_line(v: object) -> str:
+    if not isinstance(v, str):
+        return ""
+    return v.translate(_NL_STRIP) if ("\n" in v or "\r" in v) else v
 
 
 class OriginalEditor(QPlainTextEdit):
@@ -7,41 +20,84 @@ class OriginalEditor(QPlainTextEdit):
     Editor do texto original (somente leitura).
     """
 
+    # Compartilhado entre instâncias: o documento copia a opção em setDefaultTextOption.
+    _TEXT_OPTION = QTextOption()
+    _TEXT_OPTION.setWrapMode(QTextOption.NoWrap)
+
+    _SHARED_FONT: QFont | None = None
+
+    @classmethod
+    def _get_font(cls) -> QFont:
+        # Criada sob demanda (precisa da QGuiApplication) e compartilhada:
+        # QFont é implicitamente compartilhada, então só o primeiro editor
+        # paga a resolução da fonte.
+        if cls._SHARED_FONT is None:
+            font = QFont("Consolas")
+            font.setStyleHint(QFont.Monospace)
+            font.setPointSize(10)
+            cls._SHARED_FONT = font
+        return cls._SHARED_FONT
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.setReadOnly(True)
         self.setUndoRedoEnabled(False)
-        self.setWordWrapMode(QTextOption.NoWrap)
+        self.document().setUndoRedoEnabled(False)
+        self.document().setDefaultTextOption(self._TEXT_OPTION)
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.setCursorWidth(0)
 
-        font = QFont("Consolas")
-        font.setStyleHint(QFont.Monospace)
-        font.setPointSize(10)
-        self.setFont(font)
+        self.setFont(type(self)._get_font())
         self.document().setDocumentMargin(0.0)
 
+        # SoA por bloco: linha global, speaker e original já normalizado.
+        # _entries fica só como referência para get_entry_for_block.
         self._entries: list[dict] = []
-        self._rows: list[int] = []
+        self._rows = array.array("i")
+        self._speakers: list[str] = []
+        self._originals: list[str] = []
+        self._padding_fmt: QTextBlockFormat | None = None
+        self._padding_fmt_px = -1
+
+        # (id, len) da lista de entries exibida; None = documento precisa ser refeito.
+        self._content_key: tuple[int, int] | None = None
+
+    def mark_dirty(self) -> None:
+        """Força o próximo set_entries a refazer o documento (ex.: após limpar o editor)."""
+        self._content_key = None
 
     def set_entries(self, entries: list[dict], rows: list[int]):
-        self._entries = entries or []
-        self._rows = rows or []
+        entries = entries or []
+        new_rows = array.array("i", rows or [])
+
+        key = (id(entries), len(entries))
+        if self._content_key == key and entries is self._entries:
+            # Mesma lista já exibida: originais não mudam, só a numeração pode.
+            self._rows = new_rows
+            self.viewport().update()
+            return
+
+        self._entries = entries
+        self._rows = new_rows
+        self._speakers = [e.get("speaker") or "" for e in self._entries]
+        self._content_key = key
+
+        doc = self.document()
+        # Libera o limite antes de trocar o conteúdo (senão o Qt apara o topo).
+        doc.setMaximumBlockCount(0)
 
         if not self._entries:
+            self._originals = []
             self.setPlainText("")
             return
 
-        def _norm_line(v: object) -> str:
-            s = v if isinstance(v, str) else ""
-            s = s.replace("\r", "")
-            # Never allow embedded newlines inside a single entry.
-            s = s.replace("\n", "")
-            return s
-
-        text = "\n".join(_norm_line(e.get("original", "")) for e in self._entries)
-        self.setPlainText(text)
+        norm = _norm_line
+        self._originals = [norm(e.get("original")) for e in self._entries]
+        self.setPlainText("\n".join(self._originals))
+        # Um bloco por entry: fixa o tamanho do documento e mantém o undo desligado.
+        doc.setMaximumBlockCount(len(self._originals))
+        doc.setUndoRedoEnabled(False)
 
         # Small spacing between blocks (reads like padding, not blank lines)
         try:
@@ -50,19 +106,25 @@ class OriginalEditor(QPlainTextEdit):
             pass
         self.verticalScrollBar().setValue(0)
 
+    def _block_padding_format(self, px: int) -> QTextBlockFormat:
+        if self._padding_fmt is None or self._padding_fmt_px != px:
+            fmt = QTextBlockFormat()
+            fmt.setTopMargin(0)
+            fmt.setBottomMargin(float(px))
+            self._padding_fmt = fmt
+            self._padding_fmt_px = px
+        return self._padding_fmt
+
     def _apply_block_padding(self, *, px: int = 6) -> None:
-        doc = self.document()
-        cursor = QTextCursor(doc)
+        if px <= 0:
+            return
+        # Uma seleção do documento inteiro + mergeBlockFormat: o Qt aplica o
+        # formato em todos os blocos numa única passada (sem cursor por bloco).
+        cursor = QTextCursor(self.document())
         cursor.beginEditBlock()
         try:
-            block = doc.firstBlock()
-            while block.isValid():
-                c = QTextCursor(block)
-                fmt = block.blockFormat()
-                fmt.setTopMargin(0)
-                fmt.setBottomMargin(float(px))
-                c.setBlockFormat(fmt)
-                block = block.next()
+            cursor.select(QTextCursor.Document)
+            cursor.mergeBlockFormat(self._block_padding_format(px))
         finally:
             cursor.endEditBlock()
 
@@ -71,6 +133,12 @@ class OriginalEditor(QPlainTextEdit):
             return self._entries[block_number]
         return None
 
+    def get_original_for_block(self, block_number: int) -> str:
+        """Texto original (já normalizado) exibido no bloco."""
+        if 0 <= block_number < len(self._originals):
+            return self._originals[block_number]
+        return ""
+
     def get_global_row_for_block(self, block_number: int):
         """
         🔑 Número REAL da tabela para o gutter.
@@ -81,11 +149,8 @@ class OriginalEditor(QPlainTextEdit):
 
 
     def get_meta_for_block(self, block_number: int):
-        if block_number < 0 or block_number >= len(self._rows):
-            return None, ""
-
-        row = self._rows[block_number]
-        entry = self._entries[block_number]
-
-        speaker = entry.get("speaker") or ""
-        return row, speaker
+        rows = self._rows
+        speakers = self._speakers
+        if 0 <= block_number < len(rows) and block_number < len(speakers):
+            return rows[block_number], speakers[block_number]
+        return None, ""
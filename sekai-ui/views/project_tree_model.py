@@ -3,14 +3,63 @@ from __future__ import annotations
 import os
 from typing import Callable, Any
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QFileSystemModel
+from PySide6.QtCore import Qt, QAbstractItemModel, QDir, QModelIndex, QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtWidgets import QFileIconProvider
 
 from models import project_state_store
 from services.file_progress_service import get_file_progress
 
 
-class ProjectTreeModel(QFileSystemModel):
+def _list_dir(path: str) -> list[tuple[str, bool]]:
+    """
+    Conteúdo de uma pasta via os.scandir (is_dir vem do próprio DirEntry, sem
+    stat extra): [(nome, is_dir)], pastas primeiro, ordem alfabética, sem
+    nomes ocultos (".").
+    """
+    listing = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                try:
+                    d = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    d = False
+                listing.append((not d, name.lower(), name, d))
+    except OSError:
+        return []
+    listing.sort()
+    return [(name, d) for _, _, name, d in listing]
+
+
+class _DirListSignals(QObject):
+    listed = Signal(int, int, object)  # geração, nó, [(nome, is_dir)]
+
+
+class _DirListJob(QRunnable):
+    def __init__(self, signals: _DirListSignals, generation: int, node: int, path: str):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._node = node
+        self._path = path
+
+    def run(self) -> None:
+        self._signals.listed.emit(self._generation, self._node, _list_dir(self._path))
+
+
+class ProjectTreeModel(QAbstractItemModel):
+    """
+    Árvore de arquivos do projeto.
+
+    Substitui o QFileSystemModel. Cada pasta é listada só quando a view pede
+    (canFetchMore/fetchMore), num QThreadPool; os nós ficam em arrays
+    paralelos (nome / pai / is_dir / filhos), sem QFileInfo por item nem
+    watcher re-statando o disco.
+    """
+
     def __init__(self, *, project_getter: Callable[[], dict | None], supported_exts_getter: Callable[[], set[str]], live_progress_getter: Callable[[str], dict[str, Any] | None] | None = None, parent=None):
         super().__init__(parent)
         self._project_getter = project_getter
@@ -18,6 +67,255 @@ class ProjectTreeModel(QFileSystemModel):
         self._live_progress_getter = live_progress_getter
         self._progress_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
 
+        self._root_path = ""
+        self._names: list[str] = []
+        self._parent_idx: list[int] = []
+        self._is_dir = bytearray()
+        # children[i] = None enquanto a pasta não foi listada
+        self._children: list[list[int] | None] = []
+        self._row_in_parent: list[int] = []
+
+        # Listagens em andamento; a geração descarta resultados de um root antigo.
+        self._loading: set[int] = set()
+        self._generation = 0
+        self._list_signals = _DirListSignals()
+        self._list_signals.listed.connect(self._on_dir_listed)
+
+        provider = QFileIconProvider()
+        self._icon_dir = provider.icon(QFileIconProvider.Folder)
+        self._icon_file = provider.icon(QFileIconProvider.File)
+
+    # -------------------------
+    # Root / paths
+    # -------------------------
+    def setRootPath(self, path: str) -> QModelIndex:
+        # Caminhos com "/" como o QFileSystemModel: filePath() é usado como
+        # chave de _open_files e não pode variar com o separador nativo.
+        root = QDir.fromNativeSeparators(os.path.abspath(path)) if path else ""
+
+        self.beginResetModel()
+        try:
+            self._generation += 1
+            self._loading.clear()
+            self._root_path = root
+            self._progress_cache.clear()
+            if root and os.path.isdir(root):
+                # Só o nó raiz; o conteúdo vem no primeiro fetchMore da view.
+                self._names = [root]
+                self._parent_idx = [-1]
+                self._is_dir = bytearray(b"\x01")
+                self._children = [None]
+                self._row_in_parent = [0]
+            else:
+                self._names = []
+                self._parent_idx = []
+                self._is_dir = bytearray()
+                self._children = []
+                self._row_in_parent = []
+        finally:
+            self.endResetModel()
+
+        # A raiz é o índice inválido (itens de topo = conteúdo da pasta).
+        return QModelIndex()
+
+    def rootPath(self) -> str:
+        return self._root_path
+
+    def _node_path(self, node: int) -> str:
+        if node <= 0:
+            return self._root_path
+        parts: list[str] = []
+        names = self._names
+        parent_idx = self._parent_idx
+        while node > 0:
+            parts.append(names[node])
+            node = parent_idx[node]
+        parts.reverse()
+        return QDir.fromNativeSeparators(os.path.join(self._root_path, *parts))
+
+    def _node_index(self, node: int) -> QModelIndex:
+        if node <= 0:
+            return QModelIndex()
+        return self.createIndex(self._row_in_parent[node], 0, node)
+
+    def _insert_children(self, node: int, listing: list[tuple[str, bool]]) -> None:
+        if self._children[node] is not None:
+            return
+        if not listing:
+            self._children[node] = []
+            return
+
+        start = len(self._names)
+        n = len(listing)
+        self.beginInsertRows(self._node_index(node), 0, n - 1)
+        try:
+            self._names.extend(name for name, _ in listing)
+            self._parent_idx.extend([node] * n)
+            self._is_dir.extend(1 if d else 0 for _, d in listing)
+            self._children.extend(None if d else [] for _, d in listing)
+            self._row_in_parent.extend(range(n))
+            self._children[node] = list(range(start, start + n))
+        finally:
+            self.endInsertRows()
+
+    def _ensure_loaded(self, node: int) -> list[int]:
+        """Lista a pasta agora (síncrono) se ainda não foi; usado por index(path)."""
+        kids = self._children[node]
+        if kids is None:
+            self._loading.discard(node)
+            self._insert_children(node, _list_dir(self._node_path(node)))
+            kids = self._children[node] or []
+        return kids
+
+    @Slot(int, int, object)
+    def _on_dir_listed(self, generation: int, node: int, listing) -> None:
+        if generation != self._generation:
+            return
+        self._loading.discard(node)
+        if 0 <= node < len(self._children):
+            self._insert_children(node, listing or [])
+
+    def _node_for_path(self, path: str) -> int | None:
+        if not (self._root_path and self._names and path):
+            return None
+        try:
+            rel = os.path.relpath(os.path.abspath(path), self._root_path)
+        except ValueError:
+            return None
+        if rel == os.curdir:
+            return 0
+        if rel.startswith(os.pardir):
+            return None
+
+        node = 0
+        names = self._names
+        for part in rel.split(os.sep):
+            if not self._is_dir[node]:
+                return None
+            want = os.path.normcase(part)
+            for c in self._ensure_loaded(node):
+                if os.path.normcase(names[c]) == want:
+                    node = c
+                    break
+            else:
+                return None
+        return node
+
+    def _node_if_loaded(self, path: str) -> int | None:
+        """Como _node_for_path, mas sem listar pastas ainda não carregadas."""
+        if not (self._root_path and self._names and path):
+            return None
+        try:
+            rel = os.path.relpath(os.path.abspath(path), self._root_path)
+        except ValueError:
+            return None
+        if rel == os.curdir or rel.startswith(os.pardir):
+            return None
+
+        node = 0
+        names = self._names
+        for part in rel.split(os.sep):
+            kids = self._children[node]
+            if not kids:
+                return None
+            want = os.path.normcase(part)
+            for c in kids:
+                if os.path.normcase(names[c]) == want:
+                    node = c
+                    break
+            else:
+                return None
+        return node
+
+    def filePath(self, index: QModelIndex) -> str:
+        if not index.isValid():
+            return self._root_path
+        return self._node_path(int(index.internalId()))
+
+    def isDir(self, index: QModelIndex) -> bool:
+        if not index.isValid():
+            return bool(self._root_path)
+        return bool(self._is_dir[int(index.internalId())])
+
+    # -------------------------
+    # QAbstractItemModel
+    # -------------------------
+    def index(self, row_or_path, column: int = 0, parent: QModelIndex | None = None) -> QModelIndex:
+        # Compat com QFileSystemModel.index(path)
+        if isinstance(row_or_path, str):
+            node = self._node_for_path(row_or_path)
+            if not node:
+                return QModelIndex()
+            return self.createIndex(self._row_in_parent[node], 0, node)
+
+        row = int(row_or_path)
+        if column != 0 or not self._names:
+            return QModelIndex()
+        p = int(parent.internalId()) if parent is not None and parent.isValid() else 0
+        kids = self._children[p] or ()
+        if not (0 <= row < len(kids)):
+            return QModelIndex()
+        return self.createIndex(row, 0, kids[row])
+
+    def parent(self, index: QModelIndex | None = None) -> QModelIndex:
+        if index is None or not index.isValid():
+            return QModelIndex()
+        p = self._parent_idx[int(index.internalId())]
+        if p <= 0:
+            return QModelIndex()
+        return self.createIndex(self._row_in_parent[p], 0, p)
+
+    def _parent_node(self, parent: QModelIndex | None) -> int | None:
+        if not self._names:
+            return None
+        if parent is None or not parent.isValid():
+            return 0
+        if parent.column() != 0:
+            return None
+        return int(parent.internalId())
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        node = self._parent_node(parent)
+        if node is None:
+            return 0
+        return len(self._children[node] or ())
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex | None = None) -> bool:
+        node = self._parent_node(parent)
+        if node is None:
+            return False
+        kids = self._children[node]
+        if kids is None:
+            # Pasta ainda não listada: mostra o expansor sem tocar no disco.
+            return bool(self._is_dir[node])
+        return bool(kids)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._parent_node(parent)
+        if node is None:
+            return False
+        return self._children[node] is None and node not in self._loading
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._parent_node(parent)
+        if node is None or self._children[node] is not None or node in self._loading:
+            return
+        self._loading.add(node)
+        QThreadPool.globalInstance().start(
+            _DirListJob(self._list_signals, self._generation, node, self._node_path(node))
+        )
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # -------------------------
+    # Progress
+    # -------------------------
     def _current_project(self) -> dict | None:
         try:
             return self._project_getter()
@@ -30,8 +328,12 @@ class ProjectTreeModel(QFileSystemModel):
         except Exception:
             return set()
 
-    def _is_progress_candidate(self, path: str) -> bool:
-        if not path or os.path.isdir(path):
+    def _is_progress_candidate(self, path: str, is_dir: bool | None = None) -> bool:
+        if not path:
+            return False
+        if is_dir is None:
+            is_dir = os.path.isdir(path)
+        if is_dir:
             return False
         ext = os.path.splitext(path)[1].lower()
         supported = self._supported_exts()
@@ -70,9 +372,9 @@ class ProjectTreeModel(QFileSystemModel):
         except Exception:
             return ('exists',)
 
-    def _get_progress(self, path: str) -> dict[str, Any] | None:
+    def _get_progress(self, path: str, is_dir: bool | None = None) -> dict[str, Any] | None:
         project = self._current_project()
-        if not project or not self._is_progress_candidate(path):
+        if not project or not self._is_progress_candidate(path, is_dir):
             return None
 
         live = self._live_progress(path)
@@ -94,39 +396,42 @@ class ProjectTreeModel(QFileSystemModel):
         return progress
 
     def data(self, index, role=Qt.DisplayRole):
-        value = super().data(index, role)
         if not index.isValid() or index.column() != 0:
-            return value
+            return None
+
+        node = int(index.internalId())
+        name = self._names[node]
+        is_dir = bool(self._is_dir[node])
 
-        path = self.filePath(index)
-        progress = self._get_progress(path)
+        if role == Qt.DecorationRole:
+            return self._icon_dir if is_dir else self._icon_file
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+
+        path = self._node_path(node)
+        progress = self._get_progress(path, is_dir)
         if progress is None:
-            return value
+            return name
 
         if role == Qt.DisplayRole:
-            try:
-                base = str(value)
-            except Exception:
-                base = os.path.basename(path)
-            return f"{base} ({int(progress.get('percent', 0))}%)"
-
-        if role == Qt.ToolTipRole:
-            done = int(progress.get('done', 0))
-            total = int(progress.get('total', 0))
-            percent = int(progress.get('percent', 0))
-            if not progress.get('has_state'):
-                return f"{os.path.basename(path)}\nTradução: 0%\nAinda sem estado salvo para este arquivo."
-            if total == 0:
-                return f"{os.path.basename(path)}\nTradução: 100%\nArquivo sem conteúdo traduzível salvo."
-            return f"{os.path.basename(path)}\nTradução: {done}/{total} ({percent}%)"
-
-        return value
+            return f"{name} ({int(progress.get('percent', 0))}%)"
+
+        done = int(progress.get('done', 0))
+        total = int(progress.get('total', 0))
+        percent = int(progress.get('percent', 0))
+        if not progress.get('has_state'):
+            return f"{name}\nTradução: 0%\nAinda sem estado salvo para este arquivo."
+        if total == 0:
+            return f"{name}\nTradução: 100%\nArquivo sem conteúdo traduzível salvo."
+        return f"{name}\nTradução: {done}/{total} ({percent}%)"
 
     def refresh_progress(self, file_path: str | None = None) -> None:
         if file_path:
+            file_path = QDir.fromNativeSeparators(file_path)
             self._progress_cache.pop(file_path, None)
-            idx = self.index(file_path)
-            if idx.isValid():
+            node = self._node_if_loaded(file_path)
+            if node:
+                idx = self._node_index(node)
                 self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.ToolTipRole])
                 return
 
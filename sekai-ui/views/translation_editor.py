@@ -1,10 +1,88 @@
-from PySide6.QtWidgets import QPlainTextEdit
-from PySide6.QtGui import QTextOption, QFont, QKeyEvent, QTextCursor, QTextBlockFormat
-from PySide6.QtCore import Qt, Signal
+import array
+import difflib
+
+from PySide6.QtWidgets import QPlainTextEdit, QPlainTextDocumentLayout
+from PySide6.QtGui import QTextOption, QFont, QKeyEvent, QTextCursor, QTextBlockFormat, QTextDocument
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 
 from models.edit_session import EditSession
 
 
+# Mantém o invariante "1 linha = 1 entry" (mesma regra do OriginalEditor).
+# A maioria das linhas não tem quebra: o `in` (memchr) decide sem copiar.
+# Para só \r/\n o translate com tabela é o padrão; se o conjunto removido
+# crescer (ex.: caracteres de controle), trocar por um padrão pré-compilado
+# (re.compile(r"[\r\n...]+").sub) em vez de encadear replace.
+_NL_STRIP = str.maketrans("", "", "\r\n")
+
+
+# Abaixo disso o setPlainText na UI é mais barato que despachar um job.
+_ASYNC_LOAD_MIN_LINES = 5000
+
+# Linhas inseridas no documento por passo do timer na UI.
+_DOC_BUILD_BATCH = 2000
+
+
+def _clean_lines(values: list) -> list[str]:
+    table = _NL_STRIP
+    lines: list[str] = [""] * len(values)
+    for i, v in enumerate(values):
+        if isinstance(v, str):
+            lines[i] = v.translate(table) if ("\n" in v or "\r" in v) else v
+    return lines
+
+
+class _DocBuildSignals(QObject):
+    prepared = Signal(int, object, object)  # geração, linhas, textos por lote
+    failed = Signal(int, str)  # geração, mensagem
+
+
+class _DocBuildJob(QRunnable):
+    """
+    Prepara fora da UI thread só a parte em Python puro do load: limpeza das
+    linhas e o texto de cada lote. QTextDocument/QTextCursor não são
+    thread-safe; o documento é montado na UI (_build_doc_step).
+    """
+
+    def __init__(self, signals: _DocBuildSignals, generation: int, values: list):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._values = values
+
+    def run(self) -> None:
+        try:
+            lines = _clean_lines(self._values)
+            step = _DOC_BUILD_BATCH
+            chunks = ["\n".join(lines[i:i + step]) for i in range(0, len(lines), step)]
+        except Exception as e:
+            self._signals.failed.emit(self._generation, str(e))
+            return
+        self._signals.prepared.emit(self._generation, lines, chunks)
+
+
+def _u16len(s: str) -> int:
+    """Comprimento em unidades UTF-16 (a unidade das posições do QTextDocument)."""
+    return len(s) if s.isascii() else len(s.encode("utf-16-le")) // 2
+
+
+# Limites para atualizar o documento por diff em vez de setPlainText.
+_PATCH_MAX_LINES = 20000
+_PATCH_MAX_CHANGED_RATIO = 0.25
+
+
+def _offsets_for_lines(lines: list[str]) -> array.array:
+    """Posição inicial de cada bloco para o texto "\n".join(lines)."""
+    offs = array.array("i")
+    pos = 0
+    for line in lines:
+        offs.append(pos)
+        pos += _u16len(line) + 1
+    if not offs:
+        offs.append(0)
+    return offs
+
+
 class TranslationEditor(QPlainTextEdit):
     """
     Editor de tradução fiel ao SekaiTranslator antigo.
@@ -24,6 +102,20 @@ class TranslationEditor(QPlainTextEdit):
     undoRequested = Signal()
     redoRequested = Signal()
 
+    _SHARED_FONT: QFont | None = None
+
+    @classmethod
+    def _get_font(cls) -> QFont:
+        # Criada sob demanda (precisa da QGuiApplication) e compartilhada:
+        # QFont é implicitamente compartilhada, então só o primeiro editor
+        # paga a resolução da fonte.
+        if cls._SHARED_FONT is None:
+            font = QFont("Consolas")
+            font.setStyleHint(QFont.Monospace)
+            font.setPointSize(10)
+            cls._SHARED_FONT = font
+        return cls._SHARED_FONT
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -31,10 +123,7 @@ class TranslationEditor(QPlainTextEdit):
         self.setWordWrapMode(QTextOption.NoWrap)
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
 
-        font = QFont("Consolas")
-        font.setStyleHint(QFont.Monospace)
-        font.setPointSize(10)
-        self.setFont(font)
+        self.setFont(type(self)._get_font())
         self.document().setDocumentMargin(0.0)
 
         self._session: EditSession | None = None
@@ -47,14 +136,267 @@ class TranslationEditor(QPlainTextEdit):
 
         # True while EditorPanel is loading a new session; prevents marking rows as IN_PROGRESS.
         self._loading_session: bool = False
-        self.textChanged.connect(self._on_text_changed)
+
+        # Edições acumuladas (faixa de blocos) até o debounce enviar para a
+        # sessão; _dirty_full pede a normalização do documento inteiro.
+        self._dirty_first: int = -1
+        self._dirty_last: int = -1
+        self._dirty_full: bool = False
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(60)
+        self._dirty_timer.timeout.connect(self._flush_dirty_lines)
+
+        # Scroll para o topo agendado pelo load (coalescido num único singleShot).
+        self._scroll_top_pending: bool = False
+
+        # Padding (px) já aplicado ao documento atual; -1 após setPlainText.
+        self._padding_px: int = -1
+        self._padding_fmt: QTextBlockFormat | None = None
+
+        # Posição inicial de cada bloco (SoA), montada no load e usada pelo
+        # patch por diff. None = inválido (qualquer edição; refeito sob demanda).
+        self._block_offsets: array.array | None = None
+
+        # Linhas exatamente como estão no documento após o último load (None
+        # depois de qualquer edição): permite pular/atualizar por diff.
+        self._loaded_lines: list[str] | None = None
+        self._loaded_hash: int | None = None
+
+        # Load assíncrono (load_from_session_async): qualquer load/setPlainText
+        # posterior incrementa a geração e o documento atrasado é descartado.
+        self._doc_generation: int = 0
+        self._doc_build_pending: bool = False
+        self._doc_build_done = None
+        self._doc_build_signals = _DocBuildSignals(self)
+        self._doc_build_signals.prepared.connect(self._on_lines_prepared)
+        self._doc_build_signals.failed.connect(self._on_doc_build_failed)
+
+        # Montagem do documento na UI, um lote por passo (intervalo 0: o
+        # event loop processa entrada/pintura entre os lotes).
+        self._doc_build_timer = QTimer(self)
+        self._doc_build_timer.setInterval(0)
+        self._doc_build_timer.timeout.connect(self._build_doc_step)
+        self._doc_build_doc: QTextDocument | None = None
+        self._doc_build_cursor: QTextCursor | None = None
+        self._doc_build_lines: list[str] | None = None
+        self._doc_build_chunks: list[str] = []
+        self._doc_build_next: int = 0
+
+        self.document().contentsChange.connect(self._on_contents_change)
 
     def bind_edit_session(self, session: EditSession):
+        # Edições pendentes pertencem à sessão anterior.
+        self.flush_pending_edits()
         self._session = session
 
     def set_rows(self, rows: list[int]):
         self._rows = rows or []
+
+    def _session_lines(self) -> list[str]:
+        # Keep the invariant "1 line = 1 entry".
+        return _clean_lines(self._session_values())
+
+    def _session_values(self) -> list:
+        return [e.get("translation", "") for e in self._session.entries]
+
+    def _discard_doc_build(self) -> None:
+        self._doc_build_timer.stop()
+        doc = self._doc_build_doc
+        self._doc_build_doc = None
+        self._doc_build_cursor = None
+        self._doc_build_lines = None
+        self._doc_build_chunks = []
+        self._doc_build_next = 0
+        if doc is not None:
+            doc.deleteLater()
+
+    def _cancel_pending_load(self) -> None:
+        self._doc_generation += 1
+        self._doc_build_done = None
+        self._discard_doc_build()
+        if self._doc_build_pending:
+            self._doc_build_pending = False
+            self.setReadOnly(False)
+
+    def load_from_session_async(self, on_done=None) -> None:
+        """
+        Como load_from_session, mas para sessões grandes a limpeza das linhas
+        roda num QThreadPool e o documento é montado na UI em lotes, trocado
+        via setDocument quando fica pronto.
+        on_done() é chamado na UI depois que o conteúdo está no editor.
+        """
+        session = self._session
+        if (
+            not session
+            or not session.is_active()
+            or len(session.entries) < _ASYNC_LOAD_MIN_LINES
+        ):
+            self.load_from_session()
+            if on_done is not None:
+                on_done()
+            return
+
+        # Snapshot das traduções na UI (as entries só mudam aqui); a limpeza
+        # fica para o job. Sem quebras, valores == linhas do último load.
+        values = self._session_values()
+        if self._loaded_lines is not None and self._loaded_lines == values:
+            self.load_from_session()
+            if on_done is not None:
+                on_done()
+            return
+
+        # Até o documento chegar o editor fica vazio e somente leitura: nada
+        # digitado no conteúdo antigo pode cair na sessão nova.
+        self.flush_pending_edits()
+        self._loading_session = True
+        self.blockSignals(True)
+        try:
+            self.setPlainText("")
+        finally:
+            self.blockSignals(False)
+            self._loading_session = False
+        self._block_offsets = None
+        self._loaded_lines = None
+        self._loaded_hash = None
+
+        self._doc_generation += 1
+        self._doc_build_pending = True
+        self._doc_build_done = on_done
+        self.setReadOnly(True)
+
+        QThreadPool.globalInstance().start(
+            _DocBuildJob(self._doc_build_signals, self._doc_generation, values)
+        )
+
+    @Slot(int, object, object)
+    def _on_lines_prepared(self, generation: int, lines: list[str], chunks: list[str]) -> None:
+        if generation != self._doc_generation or not self._doc_build_pending:
+            return
+
+        try:
+            doc = QTextDocument(self)
+            doc.setDefaultFont(self.font())
+            doc.setDefaultTextOption(self.document().defaultTextOption())
+            doc.setDocumentMargin(0.0)
+            doc.setUndoRedoEnabled(False)
+
+            # O formato do primeiro bloco é herdado por cada bloco que o
+            # insertText cria: o padding sai sem passar pelo documento de novo.
+            fmt = QTextBlockFormat()
+            fmt.setTopMargin(0)
+            fmt.setBottomMargin(6.0)
+            cursor = QTextCursor(doc)
+            cursor.setBlockFormat(fmt)
+        except Exception as e:
+            self._on_doc_build_failed(generation, str(e))
+            return
+
+        self._doc_build_doc = doc
+        self._doc_build_cursor = cursor
+        self._doc_build_lines = lines
+        self._doc_build_chunks = chunks
+        self._doc_build_next = 0
+        self._doc_build_timer.start()
+
+    @Slot()
+    def _build_doc_step(self) -> None:
+        doc = self._doc_build_doc
+        cursor = self._doc_build_cursor
+        if doc is None or cursor is None or not self._doc_build_pending:
+            self._discard_doc_build()
+            return
+
+        i = self._doc_build_next
+        chunks = self._doc_build_chunks
+        try:
+            if i < len(chunks):
+                cursor.insertText(chunks[i] if i == 0 else "\n" + chunks[i])
+                self._doc_build_next = i + 1
+                if self._doc_build_next < len(chunks):
+                    return
+        except Exception as e:
+            self._on_doc_build_failed(self._doc_generation, str(e))
+            return
+
+        # último lote inserido: o documento sai do controle do passo
+        lines = self._doc_build_lines or []
+        self._doc_build_timer.stop()
+        self._doc_build_doc = None
+        self._doc_build_cursor = None
+        self._doc_build_lines = None
+        self._doc_build_chunks = []
+        self._doc_build_next = 0
+        try:
+            self._install_built_doc(doc, lines)
+        except Exception:
+            if self.document() is not doc:
+                doc.deleteLater()
+            self._restore_after_failed_build()
+
+    @Slot(int, str)
+    def _on_doc_build_failed(self, generation: int, message: str) -> None:
+        if generation != self._doc_generation or not self._doc_build_pending:
+            return
+        self._restore_after_failed_build()
+
+    def _restore_after_failed_build(self) -> None:
+        # Volta para o load síncrono: o editor não fica vazio/somente leitura.
+        on_done = self._doc_build_done
+        self._cancel_pending_load()
+        self.setReadOnly(False)
+        try:
+            self.load_from_session()
+        except Exception:
+            pass
+        if on_done is not None:
+            on_done()
+
+    def _install_built_doc(self, doc: QTextDocument, lines: list[str]) -> None:
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+
+        old = self.document()
+        try:
+            old.contentsChange.disconnect(self._on_contents_change)
+        except Exception:
+            pass
+
+        self._loading_session = True
+        self.blockSignals(True)
+        try:
+            self.setDocument(doc)
+            doc.setUndoRedoEnabled(True)
+        finally:
+            self.blockSignals(False)
+            self._loading_session = False
+        doc.contentsChange.connect(self._on_contents_change)
+
+        # o documento padrão pertence ao controle interno; só os nossos são liberados
+        if old.parent() is self:
+            old.deleteLater()
+
+        self._padding_px = 6
+        self._block_offsets = _offsets_for_lines(lines)
+        if len(self._block_offsets) != doc.blockCount():
+            self._rebuild_block_offsets()
+        self._loaded_lines = lines
+        self._loaded_hash = hash(tuple(lines))
+
+        on_done = self._doc_build_done
+        self._doc_build_pending = False
+        self._doc_build_done = None
+
+        self.setReadOnly(False)
+        self.moveCursor(QTextCursor.Start)
+        self._scroll_to_top_later()
+
+        if on_done is not None:
+            on_done()
+
     def load_from_session(self) -> None:
+        # o que está no debounce ainda é da sessão que vai ser relida
+        self.flush_pending_edits()
+        self._cancel_pending_load()
         # While we are loading a new session, ignore textChanged signals so
         # selecting a row does not mark it as IN_PROGRESS.
         self._loading_session = True
@@ -65,48 +407,164 @@ class TranslationEditor(QPlainTextEdit):
                     self.setPlainText("")
                 finally:
                     self.blockSignals(False)
+                self._block_offsets = array.array("i", [0])
+                self._loaded_lines = None
+                self._loaded_hash = None
                 return
 
-            # Keep the invariant "1 line = 1 entry".
-            def _norm_line(v: object) -> str:
-                s = v if isinstance(v, str) else ""
-                s = s.replace("\r", "")
-                s = s.replace("\n", "")
-                return s
+            lines = self._session_lines()
+            content_hash = hash(tuple(lines))
 
-            lines = [_norm_line(e.get("translation", "")) for e in self._session.entries]
+            old = self._loaded_lines
+            if old is not None and self._loaded_hash == content_hash and old == lines:
+                # Mesmo conteúdo (ex.: reabrir a mesma seleção): nada a refazer.
+                self.moveCursor(QTextCursor.Start)
+                self._scroll_to_top_later()
+                return
 
-            self.blockSignals(True)
+            # Undo desligado durante a carga: nem o conteúdo antigo nem os
+            # passos do patch viram comandos de undo (desligar já limpa as pilhas).
+            doc = self.document()
+            doc.setUndoRedoEnabled(False)
             try:
-                self.setPlainText("\n".join(lines))
+                patched = False
+                if old is not None:
+                    self.blockSignals(True)
+                    try:
+                        patched = self._patch_document(old, lines)
+                    finally:
+                        self.blockSignals(False)
+
+                if not patched:
+                    self.blockSignals(True)
+                    try:
+                        self.setPlainText("\n".join(lines))
+                    finally:
+                        self.blockSignals(False)
             finally:
-                self.blockSignals(False)
+                doc.setUndoRedoEnabled(True)
+                doc.clearUndoRedoStacks()
 
-            # Visual spacing (does not create blank lines)
-            try:
-                self._apply_block_padding(px=6)
-            except Exception:
-                pass
+            self._block_offsets = _offsets_for_lines(lines)
+            if len(self._block_offsets) != self.document().blockCount():
+                self._rebuild_block_offsets()
+            self._loaded_lines = lines
+            self._loaded_hash = content_hash
+
+            if not patched:
+                # Visual spacing (does not create blank lines)
+                try:
+                    self._apply_block_padding(px=6)
+                except Exception:
+                    pass
 
-            self.verticalScrollBar().setValue(0)
+            self.moveCursor(QTextCursor.Start)
+            self._scroll_to_top_later()
         finally:
             self._loading_session = False
 
-    def _apply_block_padding(self, *, px: int = 6) -> None:
+    def _scroll_to_top_later(self) -> None:
+        # setValue(0) logo após o setPlainText força o layout síncrono do
+        # documento; no próximo ciclo do event loop o load já devolveu o controle.
+        if self._scroll_top_pending:
+            return
+        self._scroll_top_pending = True
+        QTimer.singleShot(0, self._scroll_to_top)
+
+    @Slot()
+    def _scroll_to_top(self) -> None:
+        self._scroll_top_pending = False
+        self.verticalScrollBar().setValue(0)
+
+    def _patch_document(self, old: list[str], new: list[str]) -> bool:
+        """
+        Atualiza só os blocos que mudaram entre `old` (conteúdo atual do
+        documento) e `new`. False quando a diferença é grande demais e vale
+        mais um setPlainText.
+        """
+        if not old or not new or max(len(old), len(new)) > _PATCH_MAX_LINES:
+            return False
+
+        if len(old) == len(new):
+            ops = [("replace", i, i + 1, i, i + 1) for i, (a, b) in enumerate(zip(old, new)) if a != b]
+        else:
+            sm = difflib.SequenceMatcher(None, old, new, autojunk=False)
+            ops = [op for op in sm.get_opcodes() if op[0] != "equal"]
+
+        changed = sum(max(i2 - i1, j2 - j1) for _, i1, i2, j1, j2 in ops)
+        if changed > len(new) * _PATCH_MAX_CHANGED_RATIO:
+            return False
+
+        offs = self._block_offsets
+        if offs is None or len(offs) != len(old):
+            offs = self._rebuild_block_offsets()
+            if len(offs) != len(old):
+                return False
+
         doc = self.document()
+        doc_end = doc.characterCount() - 1
+        n_old = len(old)
+
         cursor = QTextCursor(doc)
         cursor.beginEditBlock()
         try:
-            block = doc.firstBlock()
-            while block.isValid():
-                c = QTextCursor(block)
-                fmt = block.blockFormat()
-                fmt.setTopMargin(0)
-                fmt.setBottomMargin(float(px))
-                c.setBlockFormat(fmt)
-                block = block.next()
+            # De trás para frente: as posições em `offs` continuam válidas.
+            for _, i1, i2, j1, j2 in reversed(ops):
+                text = "\n".join(new[j1:j2])
+                if i1 == i2:
+                    # inserção de linhas
+                    if i1 < n_old:
+                        start = end = offs[i1]
+                        text += "\n"
+                    else:
+                        start = end = doc_end
+                        text = "\n" + text
+                elif j1 == j2:
+                    # remoção de linhas (leva um separador junto)
+                    if i2 < n_old:
+                        start, end = offs[i1], offs[i2]
+                    else:
+                        start, end = max(0, offs[i1] - 1), doc_end
+                else:
+                    start = offs[i1]
+                    end = offs[i2] - 1 if i2 < n_old else doc_end
+
+                cursor.setPosition(start)
+                cursor.setPosition(end, QTextCursor.KeepAnchor)
+                cursor.insertText(text)
+        finally:
+            cursor.endEditBlock()
+
+        return True
+
+    def setPlainText(self, text: str) -> None:
+        # conteúdo trocado por fora: um documento ainda em montagem fica obsoleto
+        self._cancel_pending_load()
+        # documento novo: os formatos de bloco voltam ao padrão
+        self._padding_px = -1
+        super().setPlainText(text)
+
+    def _apply_block_padding(self, *, px: int = 6) -> None:
+        if px == self._padding_px:
+            return
+
+        fmt = self._padding_fmt
+        if fmt is None or fmt.bottomMargin() != float(px):
+            fmt = QTextBlockFormat()
+            fmt.setTopMargin(0)
+            fmt.setBottomMargin(float(px))
+            self._padding_fmt = fmt
+
+        # Mesma abordagem do OriginalEditor: uma seleção do documento inteiro
+        # e um mergeBlockFormat, em vez de um QTextCursor por bloco.
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        try:
+            cursor.select(QTextCursor.Document)
+            cursor.mergeBlockFormat(fmt)
         finally:
             cursor.endEditBlock()
+        self._padding_px = px
 
     def keyPressEvent(self, event: QKeyEvent):
         if not self._session or not self._session.is_active():
@@ -131,11 +589,13 @@ class TranslationEditor(QPlainTextEdit):
             return
 
         if is_enter and not ctrl and not shift and not alt and not meta:
+            self.flush_pending_edits()
             self.commitRequested.emit()
             event.accept()
             return
 
         if is_enter and ctrl:
+            self.flush_pending_edits()
             self.commitRequested.emit()
             self.jumpNextRequested.emit()
             event.accept()
@@ -166,55 +626,161 @@ class TranslationEditor(QPlainTextEdit):
         if not source.hasText():
             return
 
-        text = source.text().replace("\r", "")
-        lines = text.split("\n")
-
         cursor = self.textCursor()
-        start_block = cursor.blockNumber()
-
-        doc = self.document()
-        max_blocks = doc.blockCount()
-
-        self.blockSignals(True)
+        block = cursor.block()
+
+        # Só cabem as linhas do bloco atual até o fim da sessão: o split para
+        # ali, então colar 100k linhas numa sessão de 10 não gera 100k strings.
+        max_lines = max(0, self.document().blockCount() - block.blockNumber())
+        text = source.text()
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if text.endswith("\n"):
+            # como splitlines: quebra final não limpa a entry seguinte
+            text = text[:-1]
+        lines = text.split("\n", max_lines)[:max_lines]
+
+        # Um único edit block e um único cursor: o documento emite um
+        # contentsChange/textChanged só no final; os blocos seguintes são
+        # percorridos com next() em vez de findBlockByNumber por linha.
+        cursor.beginEditBlock()
         try:
-            for i, line in enumerate(lines):
-                target_block = start_block + i
-                if target_block >= max_blocks:
-                    break
-
-                block = doc.findBlockByNumber(target_block)
-                if not block.isValid():
-                    break
-
-                block_cursor = QTextCursor(block)
-                block_cursor.select(QTextCursor.LineUnderCursor)
-                block_cursor.removeSelectedText()
-                block_cursor.insertText(line)
+            for line in lines:
+                cursor.setPosition(block.position())
+                cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+                cursor.insertText(line)
+                block = block.next()
         finally:
-            self.blockSignals(False)
+            cursor.endEditBlock()
 
-        self._on_text_changed()
+        self.flush_pending_edits()
+
+    # -------------------------
+    # Block offsets
+    # -------------------------
+    def _rebuild_block_offsets(self) -> array.array:
+        offs = array.array("i")
+        block = self.document().firstBlock()
+        while block.isValid():
+            offs.append(block.position())
+            block = block.next()
+        if not offs:
+            offs.append(0)
+        self._block_offsets = offs
+        return offs
+
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int) -> None:
+        if not self._loading_session:
+            # documento divergiu do último load
+            self._loaded_lines = None
+            self._loaded_hash = None
 
-    def _on_text_changed(self):
         if self._internal_change or self._loading_session:
             return
 
+        # Offsets só são usados no load/normalização: invalidar é O(1) e evita
+        # deslocar a cauda inteira do array a cada tecla.
+        self._block_offsets = None
+
         if not self._session or not self._session.is_active():
             return
 
         doc = self.document()
-        lines: list[str] = []
+        if doc.blockCount() != len(self._session.entries):
+            # Blocos colapsados/criados: normaliza o documento inteiro (fora
+            # deste sinal, que chega no meio da edição do documento).
+            self._dirty_full = True
+        else:
+            # findBlock é O(log n) dentro do Qt; só os blocos tocados importam.
+            first = max(0, doc.findBlock(position).blockNumber())
+            last = max(first, doc.findBlock(position + chars_added).blockNumber())
+            if self._dirty_first < 0:
+                self._dirty_first, self._dirty_last = first, last
+            else:
+                self._dirty_first = min(self._dirty_first, first)
+                self._dirty_last = max(self._dirty_last, last)
 
-        block = doc.firstBlock()
-        while block.isValid():
+        self._dirty_timer.start()
+
+    def flush_pending_edits(self) -> None:
+        """
+        Envia já para a sessão o que ainda está no debounce.
+
+        Até o timer disparar as entries não refletem o documento: quem lê a
+        sessão/entries (commit, troca de sessão, reload, salvar, busca) ou as
+        altera por fora do editor (undo/redo, IA, replace) chama isto antes.
+        """
+        if self._dirty_timer.isActive() or self._dirty_full or self._dirty_first >= 0:
+            self._flush_dirty_lines()
+
+    def _flush_dirty_lines(self) -> None:
+        self._dirty_timer.stop()
+        first, last, full = self._dirty_first, self._dirty_last, self._dirty_full
+        self._dirty_first = self._dirty_last = -1
+        self._dirty_full = False
+
+        if full:
+            self._on_text_changed()
+            return
+
+        if first < 0 or not self._session or not self._session.is_active():
+            return
+
+        block = self.document().findBlockByNumber(first)
+        if first == last:
+            # uma tecla = um bloco: sem lista intermediária
+            if block.isValid():
+                self._session.on_line_edited(first, block.text())
+            return
+
+        lines: list[str] = []
+        for _ in range(last - first + 1):
+            if not block.isValid():
+                break
             lines.append(block.text())
             block = block.next()
 
+        self._session.on_lines_edited(first, last, lines)
+
+    def _on_text_changed(self):
+        """
+        Sincroniza o documento inteiro com a sessão (normalizando blocos).
+
+        Não está ligado ao textChanged: a digitação vai pelo contentsChange
+        (_on_contents_change -> on_line(s)_edited). Isto só roda como fallback
+        quando o número de blocos deixa de bater com o de entries.
+        """
+        if self._internal_change or self._loading_session:
+            return
+
+        session = self._session
+        if session is None or not session.is_active():
+            return
+
+        # sincronização completa cobre qualquer faixa pendente do debounce
+        self._dirty_timer.stop()
+        self._dirty_first = self._dirty_last = -1
+        self._dirty_full = False
+
+        doc = self.document()
+        # Um snapshot em C++ + um split, em vez de block.text() por bloco.
+        # toRawText (e não toPlainText) preserva NBSP como block.text();
+        # os blocos vêm separados por U+2029.
+        lines = doc.toRawText().split("\u2029")
+        if len(lines) != doc.blockCount():
+            # U+2029 dentro de um bloco (colado de fora) desalinha o split:
+            # volta a ler bloco a bloco.
+            lines = []
+            block = doc.firstBlock()
+            while block.isValid():
+                lines.append(block.text())
+                block = block.next()
+
         # Enforce: exactly N blocks (one per selected entry).
         # Deleting across multiple lines can remove newline separators and collapse
         # the document into fewer blocks, which makes the gutter shrink and leaves
         # stale translations in non-first entries.
-        n = len(self._session.entries)
+        n = len(session.entries)
         if n > 0 and len(lines) != n:
             normalized = (lines[:n] + [""] * max(0, n - len(lines)))[:n]
 
@@ -227,7 +793,10 @@ class TranslationEditor(QPlainTextEdit):
             self.blockSignals(True)
             try:
                 self.setPlainText("\n".join(normalized))
-                b = self.document().findBlockByNumber(cur_block)
+                offs = self._block_offsets = _offsets_for_lines(normalized)
+                if len(offs) != self.document().blockCount():
+                    offs = self._rebuild_block_offsets()
+                b = self.document().findBlock(offs[min(cur_block, len(offs) - 1)])
                 if b.isValid():
                     c2 = QTextCursor(b)
                     c2.setPosition(b.position() + min(cur_pos, len(b.text())))
@@ -236,22 +805,22 @@ class TranslationEditor(QPlainTextEdit):
                 self.blockSignals(False)
                 self._internal_change = False
 
-            self._session.on_text_edited(normalized)
+            session.on_text_edited(normalized)
             return
 
-        self._session.on_text_edited(lines)
+        session.on_text_edited(lines)
 
     def get_meta_for_block(self, block_number: int):
         """
         Retorna (row_global, speaker) para o gutter.
         """
-        if not self._session or not self._session.is_active():
-            return None, ""
-
-        if block_number < 0 or block_number >= len(self._session.rows):
+        session = self._session
+        if session is None:
             return None, ""
 
-        row = self._session.rows[block_number]
-        entry = self._session.entries[block_number]
-        speaker = entry.get("speaker") or ""
-        return row, speaker
+        # rows/speakers são paralelos (montados juntos em start/clear; sessão
+        # inativa = listas vazias), então basta checar um deles.
+        rows = session.rows
+        if 0 <= block_number < len(rows):
+            return rows[block_number], session.speakers[block_number]
+        return None, ""
@@ -1,7 +1,7 @@
-from PySide6.QtWidgets import QTableView, QHeaderView
+from PySide6.QtWidgets import QTableView, QHeaderView, QMenu
 
 from views.status_delegate import StatusDelegate
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPoint, Slot
 
 
 class TranslationTableView(QTableView):
@@ -11,8 +11,14 @@ class TranslationTableView(QTableView):
 
     - Usa delegate compatível para preservar as cores do status
     - Status é exibido por cor de fundo da linha (via model)
+    - Colunas Linha/Personagem com largura fixa (ajuste sob demanda pelo
+      menu de contexto do cabeçalho)
     """
 
+    # Larguras iniciais de Linha e Personagem. ResizeToContents consultava o
+    # sizeHint de todas as linhas a cada reset/dataChanged do model.
+    _FIXED_COLUMN_WIDTHS = {0: 60, 1: 140}
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -37,10 +43,9 @@ class TranslationTableView(QTableView):
         header.setHighlightSections(False)
         header.setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        header.setContextMenuPolicy(Qt.CustomContextMenu)
+        header.customContextMenuRequested.connect(self._on_header_context_menu)
+        self._apply_column_modes()
 
         self.setHorizontalScrollMode(QTableView.ScrollPerPixel)
         self.setVerticalScrollMode(QTableView.ScrollPerPixel)
@@ -55,3 +60,32 @@ class TranslationTableView(QTableView):
             self.viewport().setAutoFillBackground(False)
         except Exception:
             pass
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        # as seções só existem depois do model
+        self._apply_column_modes()
+
+    def _apply_column_modes(self) -> None:
+        header = self.horizontalHeader()
+        for col, width in self._FIXED_COLUMN_WIDTHS.items():
+            if col < header.count():
+                header.setSectionResizeMode(col, QHeaderView.Interactive)
+                header.resizeSection(col, width)
+        for col in (2, 3):
+            if col < header.count():
+                header.setSectionResizeMode(col, QHeaderView.Stretch)
+
+    @Slot()
+    def auto_fit_columns(self) -> None:
+        """Ajusta Linha/Personagem ao conteúdo uma vez (não a cada mudança do model)."""
+        for col in self._FIXED_COLUMN_WIDTHS:
+            if col < self.horizontalHeader().count():
+                self.resizeColumnToContents(col)
+
+    @Slot(QPoint)
+    def _on_header_context_menu(self, pos: QPoint) -> None:
+        header = self.horizontalHeader()
+        menu = QMenu(self)
+        menu.addAction("Ajustar colunas ao conteúdo", self.auto_fit_columns)
+        menu.exec(header.mapToGlobal(pos))
@@ -1,11 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import http.client
+import importlib.util
 import json
+import threading
+import urllib.parse
 import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtCore import QObject, Signal, Slot
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 é opcional (pip install "httpx[http2]"): sem o httpx ou sem o
+# pacote h2, que o httpx exige para negociar HTTP/2, segue no http.client.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+else:
+    if importlib.util.find_spec("h2") is None:
+        httpx = None
+
+
+# _run_stream: o proxy respondeu JSON comum, sem 'results' -> usar o modo em chunks.
+_STREAM_UNSUPPORTED = object()
+
 
 class AITranslateWorker(QObject):
     """
@@ -13,7 +38,12 @@ class AITranslateWorker(QObject):
 
     Para progresso real:
     - traduz em chunks (por padrão 1 linha por request)
+    - até `concurrency` chunks em voo ao mesmo tempo (resultados mantêm a ordem)
     - emite progress(done, total)
+    - com stream=True: um único POST e uma resposta NDJSON (um resultado por
+      linha); se o proxy não suportar, cai no modo em chunks
+    - com http2=True e httpx[http2] instalado: os chunks são multiplexados
+      numa única conexão HTTP/2 (asyncio), em vez do pool de threads
 
     Emite:
       - progress(int done, int total)
@@ -35,6 +65,10 @@ class AITranslateWorker(QObject):
         parent=None,
         *,
         chunk_size: int = 1,
+        use_orjson: bool = True,
+        concurrency: int = 1,
+        stream: bool = False,
+        http2: bool = False,
     ):
         super().__init__(parent)
         self.proxy_url = str(proxy_url or "").strip()
@@ -43,8 +77,47 @@ class AITranslateWorker(QObject):
         self.timeout = float(timeout)
 
         self.chunk_size = max(1, int(chunk_size or 1))
+        # Quantos chunks podem estar em voo ao mesmo tempo (1 = sequencial).
+        self.concurrency = max(1, int(concurrency or 1))
+        # orjson serializa direto para bytes UTF-8 (sem str intermediária);
+        # sem o pacote instalado, segue no json da stdlib.
+        self.use_orjson = bool(use_orjson) and orjson is not None
+        self.stream = bool(stream)
+        self.http2 = bool(http2) and httpx is not None
         self._cancel_requested = False
 
+        # progress coalescido: no máximo ~100 sinais cross-thread por execução
+        self._progress_step = 1
+        self._progress_last = 0
+
+        # Conexão keep-alive por thread do pool (no máximo `concurrency`):
+        # só o primeiro request de cada thread paga TCP + TLS.
+        parts = urllib.parse.urlsplit(self.proxy_url)
+        self._scheme = (parts.scheme or "").lower()
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        # Montados uma vez: nenhum transporte altera o dict (http.client só
+        # itera; o httpx copia). HTTP/1.1 já é keep-alive por padrão, e o
+        # cabeçalho Connection é proibido em HTTP/2.
+        self._headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self.api_token}",
+        }
+        # Proxy do sistema (HTTP(S)_PROXY / registro do Windows), que o
+        # http.client sozinho ignora. HTTPS vai num túnel CONNECT; HTTP pede a
+        # URL absoluta ao proxy.
+        self._net_proxy = self._system_proxy()
+        self._target = self._path
+        self._conn_headers = self._headers
+        if self._net_proxy and self._scheme == "http":
+            self._target = urllib.parse.urlunsplit(parts._replace(fragment=""))
+            self._conn_headers = {**self._headers, **self._proxy_auth_header()}
+        self._local = threading.local()
+        self._conns: list[http.client.HTTPConnection] = []
+        self._conns_lock = threading.Lock()
+
     @Slot()
     def cancel(self) -> None:
         self._cancel_requested = True
@@ -59,6 +132,8 @@ class AITranslateWorker(QObject):
                 raise RuntimeError("proxy_url vazio.")
             if not self.api_token:
                 raise RuntimeError("api_token vazio.")
+            if self._scheme not in ("http", "https") or not self._host:
+                raise RuntimeError("proxy_url inválido.")
 
             items = self.payload.get("items")
             if not isinstance(items, list):
@@ -76,90 +151,349 @@ class AITranslateWorker(QObject):
             custom_prompt_text = self.payload.get("custom_prompt_text")
             user_prompt = self.payload.get("user_prompt")
 
-            results: list[dict] = []
-            done = 0
-            self.progress.emit(done, total)
-
-            for start in range(0, total, self.chunk_size):
-                if self._is_canceled():
-                    self.canceled.emit()
-                    return
-
-                chunk = items[start:start + self.chunk_size]
+            base_payload: dict = {"target_language": target_language}
+            if isinstance(custom_prompt_text, str) and custom_prompt_text.strip():
+                base_payload["custom_prompt_text"] = custom_prompt_text
+            if isinstance(user_prompt, str) and user_prompt.strip():
+                base_payload["user_prompt"] = user_prompt
 
-                chunk_payload: dict = {
-                    "items": chunk,
-                    "target_language": target_language,
-                }
-                if isinstance(custom_prompt_text, str) and custom_prompt_text.strip():
-                    chunk_payload["custom_prompt_text"] = custom_prompt_text
-                if isinstance(user_prompt, str) and user_prompt.strip():
-                    chunk_payload["user_prompt"] = user_prompt
+            self._progress_step = max(1, total // 100)
+            self._progress_last = 0
+            self.progress.emit(0, total)
 
-                resp = self._post_json_bearer(
-                    self.proxy_url,
-                    self.api_token,
-                    chunk_payload,
-                    timeout=self.timeout,
-                )
-
-                if isinstance(resp, dict) and resp.get("error"):
-                    raise RuntimeError(str(resp.get("error")))
-
-                if not (isinstance(resp, dict) and isinstance(resp.get("results"), list)):
-                    raise RuntimeError("Resposta inesperada do proxy: esperado dict com 'results' list.")
-
-                for r in resp["results"]:
-                    if isinstance(r, dict):
-                        results.append(r)
-
-                done = min(total, done + len(chunk))
-                self.progress.emit(done, total)
+            try:
+                results = _STREAM_UNSUPPORTED
+                if self.stream:
+                    results = self._run_stream(items, base_payload, total)
+                if results is _STREAM_UNSUPPORTED:
+                    size = self.chunk_size
+                    chunks = [items[start:start + size] for start in range(0, total, size)]
+                    if self.http2:
+                        results = asyncio.run(self._run_chunks_http2(chunks, base_payload, total))
+                    else:
+                        results = self._run_chunks(chunks, base_payload, total)
+            finally:
+                self._close_connections()
+
+            if results is None:
+                self.canceled.emit()
+                return
 
             self.finished.emit({"results": results})
 
         except Exception as e:
             self.failed.emit(str(e))
 
-    def _post_json_bearer(self, url: str, token: str, payload: dict, *, timeout: float = 120.0) -> dict:
-        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-        req = urllib.request.Request(
-            url=url,
-            data=data,
-            method="POST",
-            headers={
-                "Content-Type": "application/json; charset=utf-8",
-                "Accept": "application/json",
-                "Authorization": f"Bearer {token}",
-            },
-        )
+    def _report_progress(self, done: int, total: int) -> None:
+        # cada emit vira um QMetaCallEvent na fila da UI; 100% sempre passa
+        if done >= total or done - self._progress_last >= self._progress_step:
+            self._progress_last = done
+            self.progress.emit(done, total)
 
+    def _run_chunks(self, chunks: list[list], base_payload: dict, total: int) -> list[dict] | None:
+        """Envia os chunks num pool de `concurrency` threads (bloqueantes em I/O);
+        devolve os resultados na ordem original ou None se cancelado."""
+        per_chunk: list[list[dict] | None] = [None] * len(chunks)
+        bodies = self._chunk_bodies(chunks, base_payload)
+        report = self._report_progress
+        done = 0
+
+        def _post(data: bytes) -> dict | None:
+            # chunks ainda na fila quando o usuário cancela nem chegam a sair
+            if self._is_canceled():
+                return None
+            return self._post_json_bearer(data)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(chunks)),
+            thread_name_prefix="ai-translate",
+        )
         try:
-            with urllib.request.urlopen(req, timeout=float(timeout)) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
+            futures = {executor.submit(_post, data): index for index, data in enumerate(bodies)}
+            for fut in as_completed(futures):
+                if self._is_canceled():
+                    return None
+
+                index = futures[fut]
+                per_chunk[index] = self._chunk_results(fut.result())
+
+                # os chunks particionam items: a soma nunca passa de total
+                done += len(chunks[index])
+                report(done, total)
+        finally:
+            # descarta o que ainda está na fila; os POSTs em voo terminam sozinhos
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if self._is_canceled():
+            return None
+
+        results: list[dict] = []
+        for chunk_results in per_chunk:
+            if chunk_results:
+                results.extend(chunk_results)
+        return results
+
+    async def _run_chunks_http2(self, chunks: list[list], base_payload: dict, total: int) -> list[dict] | None:
+        """Como _run_chunks, mas com httpx.AsyncClient: até `concurrency`
+        streams simultâneos na mesma conexão HTTP/2."""
+        per_chunk: list[list[dict] | None] = [None] * len(chunks)
+        bodies = self._chunk_bodies(chunks, base_payload)
+        sem = asyncio.Semaphore(self.concurrency)
+        client_kwargs = {"http2": True, "timeout": self.timeout, "headers": self._headers}
+        if self._net_proxy:
+            # trust_env do httpx só lê variáveis de ambiente; o registro do
+            # Windows entra pelo mesmo proxy do http.client.
+            client_kwargs["proxy"] = self._net_proxy
+        try:
+            client = httpx.AsyncClient(**client_kwargs)
+        except TypeError:
+            # httpx < 0.26: o argumento ainda se chama "proxies"
+            if "proxy" not in client_kwargs:
+                raise
+            client_kwargs["proxies"] = client_kwargs.pop("proxy")
+            client = httpx.AsyncClient(**client_kwargs)
+        async with client:
+
+            async def _one(index: int, data: bytes) -> int:
+                async with sem:
+                    if self._is_canceled():
+                        return index
+                    try:
+                        r = await client.post(self.proxy_url, content=data)
+                    except httpx.HTTPError as e:
+                        raise RuntimeError(f"Falha de conexão: {e}") from e
+                    per_chunk[index] = self._chunk_results(self._response_dict(r.status_code, r.content))
+                    return index
+
+            tasks = [asyncio.ensure_future(_one(i, data)) for i, data in enumerate(bodies)]
+            report = self._report_progress
+            done = 0
+            try:
+                for fut in asyncio.as_completed(tasks):
+                    index = await fut
+                    if self._is_canceled():
+                        return None
+                    done += len(chunks[index])
+                    report(done, total)
+            finally:
+                for t in tasks:
+                    if not t.done():
+                        t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._is_canceled():
+            return None
+
+        results: list[dict] = []
+        for chunk_results in per_chunk:
+            if chunk_results:
+                results.extend(chunk_results)
+        return results
+
+    @staticmethod
+    def _chunk_results(resp) -> list[dict]:
+        if isinstance(resp, dict) and resp.get("error"):
+            raise RuntimeError(str(resp.get("error")))
+
+        if not (isinstance(resp, dict) and isinstance(resp.get("results"), list)):
+            raise RuntimeError("Resposta inesperada do proxy: esperado dict com 'results' list.")
+
+        return [r for r in resp["results"] if isinstance(r, dict)]
+
+    def _run_stream(self, items: list, base_payload: dict, total: int):
+        """
+        Um único POST com todos os items pedindo NDJSON; cada linha da resposta
+        é um resultado e vira um progress. Devolve a lista de resultados, None
+        se cancelado ou _STREAM_UNSUPPORTED se o proxy não fizer streaming.
+        """
+        data = self._dumps({**base_payload, "items": items})
+        conn, _ = self._connection()
+        try:
+            conn.request("POST", self._target, body=data, headers={**self._conn_headers, "Accept": "application/x-ndjson"})
+            resp = conn.getresponse()
+        except Exception:
+            self._drop_connection()
+            raise
+
+        content_type = (resp.getheader("Content-Type") or "").lower()
+        if resp.status >= 400 or "ndjson" not in content_type:
+            raw_bytes = resp.read()
+            if resp.will_close:
+                self._drop_connection()
+            if resp.status < 400:
+                # JSON comum: se já veio o lote inteiro, aproveita
                 try:
-                    return json.loads(raw) if raw else {}
+                    j = self._loads(raw_bytes) if raw_bytes else {}
                 except Exception:
-                    return {"error": "Resposta inválida do servidor.", "raw": raw}
+                    j = None
+                if isinstance(j, dict) and isinstance(j.get("results"), list):
+                    self.progress.emit(total, total)
+                    return [r for r in j["results"] if isinstance(r, dict)]
+            return _STREAM_UNSUPPORTED
+
+        results: list[dict] = []
+        done = 0
+        try:
+            for raw_line in resp:
+                if self._is_canceled():
+                    # resposta pela metade: a conexão não serve mais
+                    self._drop_connection()
+                    return None
+
+                raw_line = raw_line.strip()
+                if not raw_line:
+                    continue
+
+                r = self._loads(raw_line)
+                if not isinstance(r, dict):
+                    continue
+                if r.get("error"):
+                    raise RuntimeError(str(r.get("error")))
+
+                results.append(r)
+                done = min(total, done + 1)
+                self._report_progress(done, total)
+        except Exception:
+            self._drop_connection()
+            raise
+
+        if resp.will_close:
+            self._drop_connection()
+        return results
+
+    def _connection(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Conexão da thread atual e se ela já foi usada antes (pode estar velha)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn, True
+
+        cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        if self._net_proxy:
+            proxy = urllib.parse.urlsplit(self._net_proxy)
+            conn = cls(proxy.hostname, proxy.port or 8080, timeout=self.timeout)
+            if self._scheme == "https":
+                conn.set_tunnel(self._host, self._port or 443, headers=self._proxy_auth_header())
+        else:
+            conn = cls(self._host, self._port, timeout=self.timeout)
+        self._local.conn = conn
+        with self._conns_lock:
+            self._conns.append(conn)
+        return conn, False
+
+    def _system_proxy(self) -> str:
+        """URL do proxy do sistema para o esquema do proxy_url ("" = direto)."""
+        try:
+            proxy = (urllib.request.getproxies().get(self._scheme) or "").strip()
+            if not proxy or not self._host or urllib.request.proxy_bypass(self._host):
+                return ""
+        except Exception:
+            return ""
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        try:
+            parts = urllib.parse.urlsplit(proxy)
+            if not parts.hostname:
+                return ""
+            parts.port  # porta inválida levanta ValueError aqui, não no connect
+        except ValueError:
+            return ""
+        return proxy
+
+    def _proxy_auth_header(self) -> dict:
+        """Proxy-Authorization (Basic) quando a URL do proxy traz usuário/senha."""
+        proxy = urllib.parse.urlsplit(self._net_proxy) if self._net_proxy else None
+        if proxy is None or proxy.username is None:
+            return {}
+        user = urllib.parse.unquote(proxy.username)
+        password = urllib.parse.unquote(proxy.password or "")
+        token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+        return {"Proxy-Authorization": f"Basic {token}"}
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
 
-        except urllib.error.HTTPError as e:
-            raw = ""
+    def _close_connections(self) -> None:
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
             try:
-                raw = e.read().decode("utf-8", errors="replace")
+                conn.close()
             except Exception:
                 pass
 
-            msg = f"HTTP {e.code}"
+    def _loads(self, raw_bytes: bytes):
+        # ambos aceitam bytes: o corpo só vira str quando precisa ir para a mensagem de erro
+        return orjson.loads(raw_bytes) if self.use_orjson else json.loads(raw_bytes)
+
+    def _chunk_bodies(self, chunks: list[list], base_payload: dict) -> list[bytes]:
+        """
+        Corpo JSON de cada chunk a partir de um único dict reaproveitado (só
+        "items" muda). Serializa tudo aqui, antes de despachar: com vários
+        POSTs em voo, um dict compartilhado mutado por chunk seria uma corrida.
+        """
+        dumps = self._dumps
+        chunk_payload = dict(base_payload)
+        bodies: list[bytes] = []
+        for chunk in chunks:
+            chunk_payload["items"] = chunk
+            bodies.append(dumps(chunk_payload))
+        return bodies
+
+    def _dumps(self, payload: dict) -> bytes:
+        if self.use_orjson:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def _response_dict(self, status: int, raw_bytes: bytes) -> dict:
+        """Corpo da resposta como dict; erros HTTP/JSON viram {"error": ...}."""
+        if status >= 400:
+            msg = f"HTTP {status}"
             try:
-                j = json.loads(raw) if raw else {}
+                j = self._loads(raw_bytes) if raw_bytes else {}
                 if isinstance(j, dict):
                     msg = j.get("message") or j.get("error") or msg
             except Exception:
                 pass
 
-            return {"error": msg, "http_status": e.code, "raw": raw}
+            return {"error": msg, "http_status": status, "raw": raw_bytes.decode("utf-8", errors="replace")}
+
+        try:
+            return self._loads(raw_bytes) if raw_bytes else {}
+        except Exception:
+            return {"error": "Resposta inválida do servidor.", "raw": raw_bytes.decode("utf-8", errors="replace")}
+
+    def _post_json_bearer(self, data: bytes) -> dict:
+        try:
+            while True:
+                conn, reused = self._connection()
+                try:
+                    conn.request("POST", self._target, body=data, headers=self._conn_headers)
+                    resp = conn.getresponse()
+                    raw_bytes = resp.read()
+                except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                        ConnectionResetError, BrokenPipeError):
+                    # keep-alive fechado pelo servidor entre requests: reconecta uma vez
+                    self._drop_connection()
+                    if reused:
+                        continue
+                    raise
+                except Exception:
+                    self._drop_connection()
+                    raise
+                break
+
+            if resp.will_close:
+                self._drop_connection()
+
+            return self._response_dict(resp.status, raw_bytes)
 
-        except urllib.error.URLError as e:
+        except (OSError, http.client.HTTPException) as e:
             return {"error": f"Falha de conexão: {e}"}
 
         except Exception as e: